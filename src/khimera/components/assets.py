@@ -18,7 +18,7 @@ from contextlib import AbstractContextManager
 import inspect
 from importlib.resources import files, as_file
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 from types import ModuleType
 
 from khimera.core.components import Component
@@ -175,6 +175,11 @@ class AssetSpec(FieldSpec[Asset]):
     -----
     By default, assets are not required but they are unique, implying that the host application
     expects a single asset per name.
+
+    Extensions can be provided with or without the leading dot (``".txt"`` or ``"txt"``). They are
+    matched against the end of the file path, which covers compound extensions (e.g. ``".tar.gz"``)
+    and dotfile names (e.g. ``".bashrc"``). They are normalized with a leading dot once, when
+    assigned to `file_ext`, rather than at each validation.
     """
 
     COMPONENT_TYPE = Asset
@@ -190,8 +195,20 @@ class AssetSpec(FieldSpec[Asset]):
         super().__init__(name=name, required=required, unique=unique, description=description)
         self.file_ext = file_ext
 
+    @property
+    def file_ext(self) -> Optional[Tuple[str, ...]]:
+        """Allowed file extensions, with a leading dot (None if any extension is accepted)."""
+        return self._endings
+
+    @file_ext.setter
+    def file_ext(self, value: Optional[Iterable[str]]) -> None:
+        if value is None:
+            self._endings = None
+        else:
+            self._endings = tuple(ext if ext.startswith(".") else f".{ext}" for ext in value)
+
     def validate(self, obj: Asset) -> bool:
         """Check if the asset file extension is allowed."""
-        if self.file_ext is None:
+        if self._endings is None:
             return True
-        return obj.file_path.endswith(self.file_ext)
+        return obj.file_path.endswith(self._endings)
@@ -11,12 +11,44 @@ khimera.core.components.Component
 khimera.core.specifications.FieldSpec
     Abstract base class for defining constraints and validations for components in a plugin model.
 """
-from typing import Callable, Optional, Set
+from typing import Callable, Dict, Optional, Set, Tuple
 
 from khimera.core.components import Component
 from khimera.core.specifications import FieldSpec
 
 
+# --- Group Rules ----------------------------------------------------------------------------------
+
+
+def _admits_any(_group: Optional[str], _groups: Set[str]) -> bool:
+    """Rule when both top-level commands and new groups are allowed."""
+    return True
+
+
+def _admits_known_groups(group: Optional[str], groups: Set[str]) -> bool:
+    """Rule when only predefined groups are allowed (top-level commands are then rejected too)."""
+    return group in groups
+
+
+def _admits_any_group(group: Optional[str], _groups: Set[str]) -> bool:
+    """Rule when any group is allowed but top-level commands are not."""
+    return group is not None
+
+
+def _admits_strict(group: Optional[str], groups: Set[str]) -> bool:
+    """Rule when neither top-level commands nor new groups are allowed."""
+    return group is not None and group in groups
+
+
+_GROUP_RULES: Dict[Tuple[bool, bool], Callable[[Optional[str], Set[str]], bool]] = {
+    (True, True): _admits_any,
+    (True, False): _admits_known_groups,
+    (False, True): _admits_any_group,
+    (False, False): _admits_strict,
+}
+"""Group rules keyed by the flags ``(admits_top_level, admits_new_groups)`` of a `CommandSpec`."""
+
+
 class Command(Component):
     """
     Represents a command in the host application's CLI, optionally nested in a predefined
@@ -80,6 +112,12 @@ class CommandSpec(FieldSpec[Command]):
 
     Usually the `unique` attribute is set to `False` since multiple commands can be nested in a
     single field collecting commands for a specific sub-command group.
+
+    Implementation
+    --------------
+    The group rule is selected from the `admits_top_level` and `admits_new_groups` flags at
+    initialization and whenever one of them is set, so that validation does not branch on them for
+    each command.
     """
 
     COMPONENT_TYPE = Command
@@ -97,13 +135,35 @@ class CommandSpec(FieldSpec[Command]):
         super().__init__(name=name, required=required, unique=unique, description=description)
         # Configure CLI
         self.groups = groups or set()
-        self.admits_new_groups = admits_new_groups
-        self.admits_top_level = admits_top_level
+        self._admits_new_groups = admits_new_groups
+        self._admits_top_level = admits_top_level
+        self._select_group_rule()
+
+    @property
+    def admits_new_groups(self) -> bool:
+        """Whether the plugin can add new sub-command groups."""
+        return self._admits_new_groups
+
+    @admits_new_groups.setter
+    def admits_new_groups(self, value: bool) -> None:
+        self._admits_new_groups = value
+        self._select_group_rule()
+
+    @property
+    def admits_top_level(self) -> bool:
+        """Whether the plugin can add top-level commands."""
+        return self._admits_top_level
+
+    @admits_top_level.setter
+    def admits_top_level(self, value: bool) -> None:
+        self._admits_top_level = value
+        self._select_group_rule()
+
+    def _select_group_rule(self) -> None:
+        """Select the group rule matching the current flags."""
+        flags = (bool(self._admits_top_level), bool(self._admits_new_groups))
+        self._group_rule = _GROUP_RULES[flags]
 
     def validate(self, obj: Command) -> bool:
         """Check if the command group is allowed by the host application."""
-        if obj.group is None and not self.admits_top_level:
-            return False
-        if obj.group not in self.groups and not self.admits_new_groups:
-            return False
-        return True
+        return self._group_rule(obj.group, self.groups)
@@ -16,6 +16,7 @@ from dataclasses import dataclass
 import inspect
 from types import UnionType
 from typing import Any, Callable, Union, Optional, Type, Tuple, List, get_args, get_origin
+from weakref import WeakKeyDictionary
 
 from khimera.core.components import Component
 from khimera.core.specifications import FieldSpec
@@ -39,6 +40,90 @@ class HookSignature:
     has_var_keyword: bool
     return_annotation: Any
 
+    @classmethod
+    def from_callable(cls, fn: Callable[..., Any]) -> "HookSignature":
+        """
+        Describe the signature of a function or method.
+
+        Parameters
+        ----------
+        fn : Callable
+            Function or method to describe.
+
+        Returns
+        -------
+        HookSignature
+            Positional parameters (names and annotations, in order), names of keyword-only
+            parameters, presence of `*args` and `**kwargs`, and return annotation.
+        """
+        sig = inspect.signature(fn)
+        positional: List[HookParameter] = []
+        keyword_only: List[str] = []
+        has_var_positional = False
+        has_var_keyword = False
+        for param in sig.parameters.values():
+            if param.kind in {  # check if parameter is positional
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            }:
+                positional.append(HookParameter(param.name, param.annotation))
+            elif param.kind == inspect.Parameter.KEYWORD_ONLY:
+                keyword_only.append(param.name)
+            elif param.kind == inspect.Parameter.VAR_POSITIONAL:  # *args
+                has_var_positional = True
+            elif param.kind == inspect.Parameter.VAR_KEYWORD:  # **kwargs
+                has_var_keyword = True
+        return cls(
+            positional=tuple(positional),
+            keyword_only=tuple(keyword_only),
+            has_var_positional=has_var_positional,
+            has_var_keyword=has_var_keyword,
+            return_annotation=sig.return_annotation,
+        )
+
+
+def _describe(fn: Callable[..., Any]) -> Optional[HookSignature]:
+    """Describe the signature of a function, or None if it is not introspectable."""
+    try:
+        return HookSignature.from_callable(fn)
+    except (ValueError, TypeError):  # no signature available for the callable
+        return None
+
+
+_SIGNATURES: "WeakKeyDictionary[Callable[..., Any], Optional[HookSignature]]" = WeakKeyDictionary()
+"""Descriptions of the hook functions, released with the functions themselves."""
+
+
+def describe_hook(fn: Callable[..., Any]) -> Optional[HookSignature]:
+    """
+    Describe the signature of a hook function once for all the hooks wrapping it.
+
+    Arguments
+    ---------
+    fn : Callable
+        Function or method to describe.
+
+    Returns
+    -------
+    HookSignature or None
+        Description of the signature, or None if the function does not expose an introspectable
+        signature (e.g. some builtins).
+
+    Notes
+    -----
+    Results are cached by callable, since `HookSignature` is immutable and can be shared. The cache
+    holds weak references to the callables, so that the functions of plugins which are no longer
+    used are not retained by the cache. Callables which cannot be weakly referenced (e.g. builtins)
+    or hashed are described without caching.
+    """
+    try:
+        return _SIGNATURES[fn]
+    except KeyError:
+        signature = _SIGNATURES[fn] = _describe(fn)
+        return signature
+    except TypeError:  # unhashable or not weakly referenceable callable
+        return _describe(fn)
+
 
 class Hook(Component):
     """
@@ -63,6 +148,21 @@ class Hook(Component):
         super().__init__(name=name, description=description)
         self.func = func
 
+    @property
+    def signature(self) -> Optional[HookSignature]:
+        """
+        Signature of the hook function, or None if the function does not expose an introspectable
+        signature (e.g. some builtins).
+
+        Notes
+        -----
+        The signature is looked up from the current function at each access, so that it follows
+        any reassignment of `func`. Each function is introspected once and its description is
+        cached (see `describe_hook`), so that validation against a `HookSpec` does not introspect
+        the function again.
+        """
+        return describe_hook(self.func)
+
 
 class HookSpec(FieldSpec[Hook]):
     """
@@ -140,7 +240,9 @@ class HookSpec(FieldSpec[Hook]):
 
     def validate(self, obj: Hook) -> bool:
         """Validate that the hook function matches the expected signature."""
-        signature = self.describe_signature(obj.func)
+        signature = obj.signature
+        if signature is None:
+            return False
         return self.check_inputs(signature) and self.check_output(signature.return_annotation)
 
     @staticmethod
@@ -166,32 +268,7 @@ class HookSpec(FieldSpec[Hook]):
         return_annotation : Any
             Return type annotation of the function. If None, the return type is not annotated.
         """
-        sig = inspect.signature(fn)
-        params = sig.parameters
-        return_annotation = sig.return_annotation
-        positional: List[HookParameter] = []
-        keyword_only: List[str] = []
-        has_var_positional = False
-        has_var_keyword = False
-        for param in params.values():
-            if param.kind in {  # check if parameter is positional
-                inspect.Parameter.POSITIONAL_ONLY,
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-            }:
-                positional.append(HookParameter(param.name, param.annotation))
-            elif param.kind == inspect.Parameter.KEYWORD_ONLY:
-                keyword_only.append(param.name)
-            elif param.kind == inspect.Parameter.VAR_POSITIONAL:  # *args
-                has_var_positional = True
-            elif param.kind == inspect.Parameter.VAR_KEYWORD:  # **kwargs
-                has_var_keyword = True
-        return HookSignature(
-            positional=tuple(positional),
-            keyword_only=tuple(keyword_only),
-            has_var_positional=has_var_positional,
-            has_var_keyword=has_var_keyword,
-            return_annotation=return_annotation,
-        )
+        return HookSignature.from_callable(fn)
 
     def check_inputs(self, signature: HookSignature) -> bool:
         """
@@ -205,14 +282,12 @@ class HookSpec(FieldSpec[Hook]):
         if signature.keyword_only:
             return False
         # Check exact argument names and order
-        expected_names, expected_types = zip(*self.arg_types.items())
-        actual_names = tuple(param.name for param in signature.positional)
-        actual_types = tuple(param.annotation for param in signature.positional)
-        if expected_names != actual_names:
+        positional = signature.positional
+        if tuple(param.name for param in positional) != tuple(self.arg_types):
             return False
         # Check argument types against normalized runtime types.
-        for expected, actual in zip(expected_types, actual_types):
-            if not self._matches_annotation(actual, expected):
+        for expected, param in zip(self.arg_types.values(), positional):
+            if not self._matches_annotation(param.annotation, expected):
                 return False
         # Check *args and **kwargs constraints
         if signature.has_var_positional and not self.allow_var_args:
@@ -90,6 +90,8 @@ class ComponentSet(TypeConstrainedList[Component]):
         Factory class for creating type constrained lists.
     """
 
+    __slots__ = ()  # no instance dictionary, as in the base container
+
     def __init__(self, data=None):
         super().__init__(Component, data)
 
@@ -13,7 +13,7 @@ khimera.plugins.create.Plugin
     plugin model.
 """
 from abc import abstractmethod
-from typing import Optional, Callable, Iterable, TYPE_CHECKING
+from typing import Optional, Callable, Iterable, Tuple, TYPE_CHECKING
 
 from khimera.core.specifications import Spec
 
@@ -37,12 +37,32 @@ class DependencySpec(Spec["Plugin"]):
         relationship.
     description : str, optional
         Human-readable description of the specification.
+
+    Attributes
+    ----------
+    fields : Tuple[str, ...]
+        Field names involved in the dependency, in order.
+
+    Notes
+    -----
+    The fields are also stored as a frozenset (`_field_set`), rebuilt whenever `fields` is
+    assigned, so that validation checks their presence in a plugin with a single set comparison.
     """
 
     def __init__(self, name: str, fields: Iterable[str], description: Optional[str] = None):
         super().__init__(name=name, description=description)
         self.fields = tuple(fields)
 
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Field names involved in the dependency, in order."""
+        return self._fields
+
+    @fields.setter
+    def fields(self, value: Iterable[str]) -> None:
+        self._fields = tuple(value)
+        self._field_set = frozenset(self._fields)
+
     def __str__(self):
         field_str = ", ".join(self.fields) if self.fields else ""
         return f"{self.__class__.__name__}('{self.name}'):[{field_str}]"
@@ -110,7 +130,7 @@ class PredicateDependency(DependencySpec):
 
     def validate(self, obj: "Plugin") -> bool:
         """Validate the dependencies globally in the plugin instance."""
-        components = {field: obj.components.get(field) for field in self.fields}
-        if None in components.values():
+        components = obj.components
+        if not components.keys() >= self._field_set:  # missing fields
             return False
-        return self.predicate(**components)
+        return self.predicate(**{field: components[field] for field in self.fields})
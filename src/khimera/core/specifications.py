@@ -46,6 +46,9 @@ class Spec(ABC, Generic[O], DeepCopyable, DeepComparable):
         Description of the Spec.
     """
 
+    IO_BOUND: bool = False
+    """Whether `validate` blocks on IO (disk, network), so that it can be run in worker threads."""
+
     def __init__(self, name: str, description: Optional[str] = None):
         self.name = name
         self.description = description
@@ -5,8 +5,8 @@ khimera.discovery.find
 Discovers plugins on the host application side.
 """
 from abc import ABC, abstractmethod
-import importlib.metadata
-from typing import Optional, List
+import importlib
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from khimera.utils.factories import TypeConstrainedList
 from khimera.plugins.declare import PluginModel
@@ -129,11 +129,47 @@ class PluginFinder(ABC):
 
     To do so, all the plugins are stored in a list rather than a dictionary. Thus, plugins are not
     named, which allows to store multiple plugins of the same name but different versions.
+
+    To look up plugins without scanning the whole list, the stored plugins are also indexed, in
+    storage order:
+
+    - By name, for `get`.
+    - By model object (identity), for `filter`. Models are compared by deep comparison, which is
+      costly: this index allows to compare the requested model once with each distinct model object,
+      rather than once with the model of each plugin.
+
+    The indices are updated by `store`, `store_many` and `clear`, and rebuilt when the `plugins`
+    attribute is assigned. To keep them consistent with the stored plugins, the `plugins` attribute
+    exposes a read-only tuple: the plugins can only be added through `store` and `store_many`, or
+    replaced as a whole by assigning the attribute. Plugins should not be renamed nor assigned
+    another model once stored.
     """
 
-    def __init__(self):
-        self.plugins = TypeConstrainedList(Plugin)
-        """All the discovered plugins."""
+    def __init__(self) -> None:
+        self._plugins: TypeConstrainedList[Plugin] = TypeConstrainedList(Plugin)
+        self._by_name: Dict[str, List[Plugin]] = {}
+        """Discovered plugins grouped by name, in storage order."""
+        self._by_model: Dict[int, Tuple[Optional[PluginModel], List[Plugin]]] = {}
+        """Discovered plugins grouped by the identity of their model (with the model itself, which
+        keeps its identifier valid), in storage order."""
+        self._snapshot: Optional[Tuple[Plugin, ...]] = ()
+        """Read-only view of the stored plugins, built at the first access after a change."""
+
+    @property
+    def plugins(self) -> Tuple[Plugin, ...]:
+        """All the discovered plugins, in storage order (read-only)."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self._plugins)
+        return self._snapshot
+
+    @plugins.setter
+    def plugins(self, plugins: Iterable[Plugin]) -> None:
+        self._plugins = TypeConstrainedList(Plugin, plugins)
+        self._snapshot = None
+        self._by_name = {}
+        self._by_model = {}
+        for plugin in self._plugins:
+            self._index(plugin)
 
     @abstractmethod
     def discover(self):
@@ -146,13 +182,55 @@ class PluginFinder(ABC):
 
         Notes
         -----
-        Type checking is performed automatically by the `TypeConstrainedList` class.
+        Type checking is performed automatically by the `TypeConstrainedList` class, before the
+        plugin is indexed.
+        """
+        self._plugins.append(plugin)
+        self._snapshot = None
+        self._index(plugin)
+
+    def store_many(self, plugins: Iterable[Plugin]) -> None:
+        """
+        Stores several discovered plugins at once.
+
+        Arguments
+        ---------
+        plugins : Iterable[Plugin]
+            Plugins to store, in order.
+
+        Raises
+        ------
+        TypeError
+            If any of the plugins is not a `Plugin` instance. In this case, none of the plugins is
+            stored.
+
+        Notes
+        -----
+        Type checking is performed in a single pass over the plugins by the `extend` method of the
+        `TypeConstrainedList` class, before the plugins are added to the list.
         """
-        self.plugins.append(plugin)
+        plugins = list(plugins)
+        self._plugins.extend(plugins)
+        self._snapshot = None
+        for plugin in plugins:
+            self._index(plugin)
+
+    def clear(self) -> None:
+        """Removes all the stored plugins, to start a new discovery with the same finder."""
+        self._plugins.clear()
+        self._snapshot = ()
+        self._by_name.clear()
+        self._by_model.clear()
+
+    def _index(self, plugin: Plugin) -> None:
+        """Indexes a stored plugin by name and by model."""
+        self._by_name.setdefault(plugin.name, []).append(plugin)
+        model = plugin.model
+        self._by_model.setdefault(id(model), (model, []))[1].append(plugin)
 
     def __iter__(self):
         """Iterates over the discovered plugins."""
-        return iter(self.plugins)
+        return iter(self._plugins)
 
     def get(self, name: str, version: Optional[str] = None) -> List[Plugin]:
         """
@@ -168,13 +246,12 @@ class PluginFinder(ABC):
         Returns
         -------
         List[Plugin]
-            Plugins matching the criteria (may be empty).
+            Plugins matching the criteria (may be empty), in storage order.
         """
-        return [
-            plugin
-            for plugin in self.plugins
-            if plugin.name == name and (version is None or plugin.version == version)
-        ]
+        candidates = self._by_name.get(name, [])
+        if version is None:
+            return list(candidates)  # copy, to protect the index
+        return [plugin for plugin in candidates if plugin.version == version]
 
     def get_one(self, name: str, version: Optional[str] = None) -> Plugin:
         """
@@ -222,7 +299,18 @@ class PluginFinder(ABC):
         model : PluginModel
             Plugin model specifying the expected structure and components of the plugins.
             If not provided, all the plugins are considered regardless of the model they adhere to.
+
+        Notes
+        -----
+        The requested model is compared with each distinct model object of the stored plugins. If
+        several distinct model objects are equal to it, the plugins are collected from the whole
+        list to preserve the storage order.
         """
         if model is None:
-            return self.plugins
-        return [plugin for plugin in self.plugins if plugin.model == model]
+            return list(self._plugins)
+        buckets = [plugins for candidate, plugins in self._by_model.values() if candidate == model]
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            return list(buckets[0])  # copy, to protect the index
+        return [plugin for plugin in self._plugins if plugin.model == model]
@@ -9,14 +9,37 @@ See Also
 khimera.discovery.find
     Base classes for plugin discovery.
 """
+from functools import lru_cache
 import importlib.metadata
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from khimera.discovery.find import PluginFinder, PluginEntryPoint
 from khimera.plugins.create import Plugin
 from khimera.exceptions import KhimeraError
 
 
+# --- Entry Points Retrieval -----------------------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def _cached_entry_points(group: str) -> Tuple[importlib.metadata.EntryPoint, ...]:
+    """Entry points declared by the installed packages in a group, retrieved once per group."""
+    return tuple(importlib.metadata.entry_points(group=group))
+
+
+def clear_entry_points_cache() -> None:
+    """
+    Forget the entry points retrieved so far, so that the next discovery scans the installed
+    packages again (e.g. after installing a plugin package at runtime).
+
+    Notes
+    -----
+    This function is called by `FromInstalledFinder.clear`, before a new discovery with the same
+    finder.
+    """
+    _cached_entry_points.cache_clear()
+
+
 # --- FromInstalledFinder --------------------------------------------------------------------------
 
 
@@ -96,7 +119,19 @@ class FromInstalledFinder(PluginFinder):
                 )
             self.store(plugin)
 
-    def get_entry_points(self):
+    def clear(self) -> None:
+        """
+        Removes all the stored plugins, to start a new discovery with the same finder.
+
+        Notes
+        -----
+        The cache of the retrieved entry points is cleared as well (see `clear_entry_points_cache`),
+        so that the new discovery takes into account the packages installed in the meantime.
+        """
+        super().clear()
+        clear_entry_points_cache()
+
+    def get_entry_points(self) -> List[importlib.metadata.EntryPoint]:
         """
         Finds all installed plugins that declare entry points for the host application.
 
@@ -109,9 +144,17 @@ class FromInstalledFinder(PluginFinder):
         ------
         RuntimeError
             If entry points retrial fails.
+
+        Notes
+        -----
+        Retrieving entry points scans the metadata of all the distributions installed on `sys.path`.
+        The result is cached by group, and shared by all the finders of the same group until a
+        finder is cleared (see `clear`). Failures are not cached. To take into account packages
+        installed after the first discovery, clear the finder before discovering again, or call
+        `clear_entry_points_cache`.
         """
         try:
-            return importlib.metadata.entry_points(group=self.entry_point_group)
+            return list(_cached_entry_points(self.entry_point_group))
         except Exception as exc:
             raise RuntimeError(
                 f"Failed to retrieve entry points for {self.entry_point_group}: {exc}"
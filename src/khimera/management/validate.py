@@ -11,8 +11,9 @@ khimera.plugins.declare
 khimera.plugins.create
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 
 from khimera.plugins.create import Plugin
 
@@ -73,14 +74,56 @@ class PluginValidator:
         """Check if components are unknown."""
         self.unknown = [field for field in self.plugin.components if field not in self.model.fields]
 
-    def check_rules(self) -> None:
-        """Validate the components of the plugin instance against the rules of the model."""
+    def check_rules(self, parallel: bool = False, max_workers: Optional[int] = None) -> None:
+        """
+        Validate the components of the plugin instance against the rules of the model.
+
+        Arguments
+        ---------
+        parallel : bool, default=False
+            Whether to run the rules of IO-bound specifications (``IO_BOUND = True``) in a thread
+            pool. Rules of other specifications are always run sequentially, since threads do not
+            speed up CPU-bound Python code.
+        max_workers : int, optional
+            Maximum number of worker threads, if `parallel` is True. Defaults to the
+            `ThreadPoolExecutor` default.
+
+        Notes
+        -----
+        Fields absent from the model are skipped, since they are reported by `check_unknown`.
+
+        The thread pool is only created at the first IO-bound specification, so that no thread is
+        started if all the rules are run sequentially.
+        """
         invalid: Dict = {}
-        for field, comps in self.plugin.components.items():  # field: field name, comps: list
-            spec = self.model.get(field)  # spec to use for validation
-            invalid_components = [item for item in comps if not spec.validate(item)]
-            if invalid_components:
-                invalid[field] = invalid_components
+        executor: Optional[ThreadPoolExecutor] = None
+        try:
+            outcomes = []  # field, components, validation results (booleans or futures)
+            for field, comps in self.plugin.components.items():  # field: field name, comps: list
+                spec = self.model.get(field)  # spec to use for validation
+                if spec is None:  # unknown field, reported by `check_unknown`
+                    continue
+                validate = spec.validate
+                if parallel and spec.IO_BOUND:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=max_workers)
+                    results: List[Union[bool, Future[bool]]] = [
+                        executor.submit(validate, item) for item in comps
+                    ]
+                else:
+                    results = [validate(item) for item in comps]
+                outcomes.append((field, comps, results))
+            for field, comps, results in outcomes:
+                invalid_components = [
+                    item
+                    for item, result in zip(comps, results)
+                    if not (result.result() if isinstance(result, Future) else result)
+                ]
+                if invalid_components:  # stored once per field, in bulk
+                    invalid[field] = invalid_components
+        finally:
+            if executor is not None:
+                executor.shutdown()
         self.invalid = invalid
 
     def check_dependencies(self) -> None:
@@ -89,10 +132,20 @@ class PluginValidator:
             field for field, spec in self.model.dependencies.items() if not spec.validate(self.plugin)
         ]
 
-    def validate(self) -> ValidationResult:
+    def validate(
+        self, parallel: bool = False, max_workers: Optional[int] = None
+    ) -> ValidationResult:
         """
         Validate the components of the plugin instance against its model.
 
+        Arguments
+        ---------
+        parallel : bool, default=False
+            Whether to run the rules of IO-bound specifications in a thread pool (see
+            `check_rules`).
+        max_workers : int, optional
+            Maximum number of worker threads, if `parallel` is True (see `check_rules`).
+
         Returns
         -------
         ValidationResult
@@ -101,7 +154,7 @@ class PluginValidator:
         self.check_required()
         self.check_unique()
         self.check_unknown()
-        self.check_rules()
+        self.check_rules(parallel=parallel, max_workers=max_workers)
         self.check_dependencies()
         return ValidationResult(
             missing=list(self.missing),
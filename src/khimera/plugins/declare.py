@@ -152,7 +152,7 @@ class PluginModel(DeepCopyable, DeepComparable):
                 f"Unsupported field type: '{type(spec)}' "
                 "(must be a subclass of 'Spec': either 'FieldSpec' or 'DependencySpec')"
             )
-        if spec.name in self.specs:
+        if spec.name in self.fields or spec.name in self.dependencies:
             raise KeyError(f"Spec '{spec.name}' already declared in the plugin model")
         if isinstance(spec, FieldSpec):
             self.fields[spec.name] = spec
@@ -188,8 +188,18 @@ class PluginModel(DeepCopyable, DeepComparable):
         return self
 
     def get(self, name: str) -> Spec | None:
-        """Get a `Spec` from the plugin model by name. None if not present in the model."""
-        return self.specs.get(name)
+        """
+        Get a `Spec` from the plugin model by name. None if not present in the model.
+
+        Notes
+        -----
+        The two underlying dictionaries are queried in turn rather than through the merged `specs`
+        property, which would rebuild a dictionary of all the specifications at each call.
+        """
+        spec = self.fields.get(name)
+        if spec is not None:
+            return spec
+        return self.dependencies.get(name)
 
     def filter(
         self,
@@ -32,11 +32,40 @@ beartype.door.is_bearable(obj: object, hint: object) -> bool
     Here, the default strategy is used, which implies that containers should have homogeneous
     elements when nested in `TypeConstrainedList` or `TypeConstrainedDict` instances. Erroneous
     mixed types might not be detected.
-"""
-from collections import UserDict, UserList
-from typing import Generic, TypeVar, Optional, Iterable, Any, Dict, Tuple, SupportsIndex, overload
 
-from beartype.door import is_bearable
+Implementation
+--------------
+Type hints are resolved once into validator callables (see `make_validator`) when a constrained
+container is created, so that inserting items does not re-parse the hint on every call. Plain
+classes and unions of plain classes are checked with `isinstance`, while other hints are delegated
+to `is_bearable`. Beartype is imported lazily, the first time such a complex hint is encountered, to
+keep it out of the import time of the package.
+"""
+import copy
+import random
+import types
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import (
+    Generic,
+    TypeVar,
+    Optional,
+    Iterable,
+    Any,
+    List,
+    Self,
+    Callable,
+    Dict,
+    NamedTuple,
+    Tuple,
+    Type,
+    SupportsIndex,
+    Union,
+    get_args,
+    get_origin,
+    overload,
+    Protocol,
+)
 
 
 KT = TypeVar("KT")
@@ -46,9 +75,154 @@ VT = TypeVar("VT")
 """Type variable for the value type of a dictionary or list."""
 
 
+class _Restorable(Protocol):  # pylint: disable=too-few-public-methods
+    """Object whose state can be restored after its creation (constrained containers)."""
+
+    def __setstate__(self, state: Dict[str, object]) -> None: ...
+
+
+CT = TypeVar("CT", bound=_Restorable)
+"""Type variable for a constrained container class (see `_restore`)."""
+
+
 # --- Type Utilities -------------------------------------------------------------------------------
 
 
+Validator = Callable[[Any], bool]
+"""Type alias for a callable checking whether an object matches a type hint."""
+
+
+class HintInfo(NamedTuple):
+    """
+    Record of the analysis of a type hint.
+
+    Attributes
+    ----------
+    kind : int
+        Kind of hint: `ANY_HINT`, `CLASS_HINT`, `UNION_HINT` (union of plain classes) or
+        `COMPLEX_HINT` (any other hint, checked with `is_bearable`).
+    types : Tuple[type, ...]
+        Classes to pass to `isinstance` for class and union hints, empty otherwise.
+    display : str
+        Name of the hint displayed in error messages.
+    """
+
+    kind: int
+    types: Tuple[type, ...]
+    display: str
+
+
+ANY_HINT, CLASS_HINT, UNION_HINT, COMPLEX_HINT = range(4)
+"""Kinds of type hints distinguished by `resolve_hint`."""
+
+_UNION_ORIGINS = frozenset({Union, types.UnionType})
+"""Origins of union hints, for both `Union[X, Y]` and PEP 604 `X | Y` syntaxes."""
+
+
+def _is_plain_class(hint: object) -> bool:
+    """Check if a type hint is a plain class which can be passed to `isinstance`."""
+    return (
+        isinstance(hint, type)
+        and get_origin(hint) is None  # exclude parametrized generics, e.g. `list[int]`
+        and hint is not Any
+        and not getattr(hint, "_is_protocol", False)  # exclude protocols
+    )
+
+
+def _analyze_hint(hint: object) -> HintInfo:
+    """Analyze a type hint (see `resolve_hint`)."""
+    display = hint.__name__ if hasattr(hint, "__name__") else str(hint)  # class or complex hint
+    if hint is Any or hint is object:
+        return HintInfo(ANY_HINT, (), display)
+    if _is_plain_class(hint):
+        return HintInfo(CLASS_HINT, (hint,), display)  # type: ignore[arg-type]
+    if get_origin(hint) in _UNION_ORIGINS:
+        members = get_args(hint)
+        if all(_is_plain_class(member) for member in members):
+            return HintInfo(UNION_HINT, members, display)
+    return HintInfo(COMPLEX_HINT, (), display)
+
+
+_analyze_hint_cached = lru_cache(maxsize=None)(_analyze_hint)
+
+
+def resolve_hint(hint: object) -> HintInfo:
+    """
+    Analyze a type hint once to determine how objects should be checked against it.
+
+    Arguments
+    ---------
+    hint : object
+        Type hint, under the form of a single type or a complex type hint.
+
+    Returns
+    -------
+    HintInfo
+        Record of the hint kind, the classes to check and the name to display.
+
+    Notes
+    -----
+    Results are cached for hashable hints, so that the analysis is shared by all the containers
+    constrained by the same hint.
+    """
+    try:
+        return _analyze_hint_cached(hint)
+    except TypeError:  # unhashable hint
+        return _analyze_hint(hint)
+
+
+def _build_validator(hint: object) -> Validator:
+    """Build a validator for a type hint (see `make_validator`)."""
+    kind, classes, _ = resolve_hint(hint)
+    if kind == ANY_HINT:
+        return lambda value: True
+    if kind == CLASS_HINT:
+        cls = classes[0]
+        return lambda value: isinstance(value, cls)
+    if kind == UNION_HINT:
+        exact = frozenset(classes)
+        return lambda value: type(value) in exact or isinstance(value, classes)
+    from beartype.door import is_bearable  # pylint: disable=import-outside-toplevel
+
+    return lambda value: is_bearable(value, hint)
+
+
+_build_validator_cached = lru_cache(maxsize=None)(_build_validator)
+
+
+def make_validator(hint: object) -> Validator:
+    """
+    Get a callable checking whether an object matches a type hint.
+
+    Arguments
+    ---------
+    hint : object
+        Type hint to check objects against, under the form of a single type or a complex type hint.
+
+    Returns
+    -------
+    Validator
+        Callable taking an object and returning a boolean indicating whether it matches the hint.
+
+    Notes
+    -----
+    The hint is inspected only once, when building the validator (see `resolve_hint`):
+
+    - Plain classes: `isinstance` is called with the class.
+    - Unions of plain classes: `type(value)` is looked up among the union members before falling
+      back to `isinstance` with the tuple of members (for subclasses and abstract bases).
+    - Other hints (parametrized generics, unions including such generics...): `is_bearable` is
+      called with the hint.
+
+    Validators are cached by hint, so that containers constrained by the same hint share the same
+    validator object.
+    """
+    try:
+        return _build_validator_cached(hint)
+    except TypeError:  # unhashable hint
+        return _build_validator(hint)
+
+
 def error_message(item: Any, expected_type: object, spec: Optional[str] = None) -> str:
     """Generate an error message for an invalid item.
 
@@ -61,19 +235,99 @@ def error_message(item: Any, expected_type: object, spec: Optional[str] = None)
     spec : str, optional
         Specification of the item, used to generate a more informative error message.
     """
-    actual_type = type(item).__name__
-    expected = (
-        expected_type.__name__
-        if hasattr(expected_type, "__name__")  # class type
-        else str(expected_type)  # complex type hint
-    )
-    return f"Invalid {spec} type: got {actual_type} instead of {expected}"
+    return error_template(expected_type, spec) % type(item).__name__
+
+
+def error_template(expected_type: object, spec: Optional[str] = None) -> str:
+    """Generate the template of the error message for invalid items, to be formatted with the
+    name of the actual type of an item (see `error_message`)."""
+    expected = resolve_hint(expected_type).display.replace("%", "%%")
+    return f"Invalid {spec} type: got %s instead of {expected}"
+
+
+_IMMUTABLE_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None)})
+"""Classes whose instances are immutable, hence can be shared between a container and its copies."""
+
+
+def _is_immutable_hint(hint: object) -> bool:
+    """Check if all the objects matching a type hint are instances of immutable builtin classes."""
+    kind, classes, _ = resolve_hint(hint)
+    return kind in (CLASS_HINT, UNION_HINT) and all(cls in _IMMUTABLE_TYPES for cls in classes)
+
+
+def _deepcopy_items(items: Iterable[Any], immutable: bool, memo: Dict[int, Any]) -> Iterable[Any]:
+    """Deep copy items, or return them as is if they are immutable (see `__deepcopy__`)."""
+    return items if immutable else (copy.deepcopy(item, memo) for item in items)
+
+
+def hint_covers(outer: object, inner: object) -> bool:
+    """
+    Check if all the objects matching a type hint also match another hint, without inspecting
+    the objects themselves.
+
+    Arguments
+    ---------
+    outer : object
+        Type hint expected to be broader.
+    inner : object
+        Type hint expected to be narrower.
+
+    Returns
+    -------
+    bool
+        True if the hints are equal, if `outer` admits any object, or if both hints are classes (or
+        unions of classes) and each class of `inner` is a subclass of a class of `outer`. False
+        otherwise, including when the relation cannot be determined for complex hints.
+    """
+    if outer is inner:
+        return True
+    outer_info, inner_info = resolve_hint(outer), resolve_hint(inner)
+    if outer_info.kind == ANY_HINT:
+        return True
+    if outer_info.kind == COMPLEX_HINT or inner_info.kind not in (CLASS_HINT, UNION_HINT):
+        return outer == inner
+    return all(issubclass(cls, outer_info.types) for cls in inner_info.types)
+
+
+def _restore(cls: Type[CT], state: Dict[str, object]) -> CT:
+    """Create an empty constrained container from a pickled or copied state (see `__reduce__`)."""
+    container = cls.__new__(cls)
+    container.__setstate__(state)
+    return container
+
+
+def _extra_state(container: object, base: type) -> Dict[str, object]:
+    """
+    Get the attributes added to a constrained container by the subclasses of its base class.
+
+    Arguments
+    ---------
+    container : object
+        Constrained container to pickle or copy.
+    base : type
+        Constrained container class declaring the slots handled by its own `__getstate__`.
+
+    Returns
+    -------
+    Dict[str, object]
+        Values of the slots declared by the subclasses of `base` in the MRO of the container (if
+        set), and of the attributes stored in its instance dictionary (if any).
+    """
+    state = dict(getattr(container, "__dict__", {}))
+    for cls in type(container).__mro__:
+        if cls is base:
+            break
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(container, name):
+                state[name] = getattr(container, name)
+    return state
 
 
 # --- Type-Constrained List ------------------------------------------------------------------------
 
 
-class TypeConstrainedList(UserList[VT], Generic[VT]):
+class TypeConstrainedList(list[VT], Generic[VT]):
     """
     List subclass that constrains the type of its elements.
 
@@ -83,7 +337,7 @@ class TypeConstrainedList(UserList[VT], Generic[VT]):
         Allowed type(s) for the list elements, under the form of a single type of a complex type
         hint. Multiple types can be allowed using a Union type.
     data : List[VT]
-        Underlying list data, inherited from `UserList`.
+        Initial elements of the list.
 
     Examples
     --------
@@ -114,11 +368,17 @@ class TypeConstrainedList(UserList[VT], Generic[VT]):
     >>> from typing import Union
     >>> l = TypeConstrainedList(Union[str, List[str]], ['a', ['b', 'c']])
 
-    See Also
-    --------
-    collections.UserList
+    Notes
+    -----
+    The class subclasses `list` directly: reads (indexing, iteration, length...) are inherited from
+    the builtin type, and only the mutating methods are overridden to check the inserted values.
+    Copies, slices and concatenations are returned as constrained lists of the same class.
+    The `data` property is kept for compatibility with the former `UserList` base, and returns the
+    list itself.
     """
 
+    __slots__ = ("value_type", "_check", "_error_template")
+
     def __init__(self, value_type: object, data: Iterable[VT] = ()):
         """
         Initialize the list with the type of its elements.
@@ -130,20 +390,94 @@ class TypeConstrainedList(UserList[VT], Generic[VT]):
         data : Iterable[VT], optional
             Initial data to populate the list with.
         """
-        self.value_type = value_type
+        self._constrain(value_type)
         super().__init__()  # initialize with empty list
         if data:  # populate with initial data
             self.extend(data)
 
+    def _constrain(self, value_type: object) -> None:
+        """Set the type constraint and the derived validator and error template."""
+        self.value_type = value_type
+        self._check = make_validator(value_type)
+        self._error_template = error_template(value_type, spec="value")
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Get the state to pickle or copy: the type hint, from which the validator is rebuilt, and
+        the attributes added by subclasses (see `_extra_state`)."""
+        state = _extra_state(self, TypeConstrainedList)
+        state["value_type"] = self.value_type
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """Restore the type constraint and the attributes of subclasses from a pickled or copied
+        state."""
+        for name, value in state.items():
+            if name != "value_type":
+                setattr(self, name, value)
+        self._constrain(state["value_type"])
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Support pickling and copying: restore the constraint before re-inserting the values."""
+        return (_restore, (type(self), self.__getstate__()), None, iter(self))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Self:
+        """
+        Create a deep copy of the list without checking the copied values again.
+
+        Notes
+        -----
+        Copies of valid values are valid, so that they are inserted directly in the new list.
+        Values of immutable builtin types are shared rather than copied. Attributes added by
+        subclasses are deep copied.
+        """
+        clone = _restore(type(self), {"value_type": self.value_type})
+        memo[id(self)] = clone
+        for name, value in _extra_state(self, TypeConstrainedList).items():
+            setattr(clone, name, copy.deepcopy(value, memo))
+        immutable = _is_immutable_hint(self.value_type)
+        list.extend(clone, _deepcopy_items(self, immutable, memo))
+        return clone
+
+    def copy(self) -> Self:
+        """Create a shallow copy of the list, with the same type constraint."""
+        clone = _restore(type(self), self.__getstate__())
+        list.extend(clone, self)  # values already checked
+        return clone
+
+    @overload
+    def __getitem__(self, key: SupportsIndex) -> VT: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Self: ...
+
+    def __getitem__(self, key: SupportsIndex | slice) -> VT | Self:
+        """Override the `list` getter method to return slices with the same type constraint."""
+        if isinstance(key, slice):
+            clone = _restore(type(self), self.__getstate__())
+            list.extend(clone, super().__getitem__(key))  # values already checked
+            return clone
+        return super().__getitem__(key)
+
+    def __add__(self, other: Iterable[VT]) -> Self:  # type: ignore[override]
+        """Override the concatenation of `list` to return a list with the same type constraint."""
+        clone = self.copy()
+        clone.extend(other)
+        return clone
+
+    @property
+    def data(self) -> List[VT]:
+        """Elements of the list (the list itself)."""
+        return self
+
     def is_valid(self, value: Any) -> bool:
         """
         Check if the value is of the correct type, matched against the `value_type` attribute.
 
         See Also
         --------
-        beartype.door.is_bearable(obj: object, hint: object) -> bool
+        make_validator
         """
-        return is_bearable(value, self.value_type)
+        return self._check(value)
 
     @overload
     def __setitem__(self, key: SupportsIndex, value: VT) -> None: ...
@@ -151,7 +485,7 @@ class TypeConstrainedList(UserList[VT], Generic[VT]):
     @overload
     def __setitem__(self, key: slice, value: Iterable[VT]) -> None: ...
 
-    def __setitem__(self, key, value) -> None:
+    def __setitem__(self, key: SupportsIndex | slice, value: Any) -> None:
         """
         Override the `list` setter method to constrain the type of the assigned value.
 
@@ -165,36 +499,125 @@ class TypeConstrainedList(UserList[VT], Generic[VT]):
         if isinstance(key, slice):  # check values in slice
             if not isinstance(value, Iterable):
                 raise TypeError("For slice assignment, value must be an iterable")
-            for item in value:
-                if not self.is_valid(item):
-                    raise TypeError(self.error_message(item))
+            super().__setitem__(key, self._validated(value))
         else:  # check single item
-            if not self.is_valid(value):
+            if not self._check(value):
                 raise TypeError(self.error_message(value))
-        super().__setitem__(key, value)  # call superclass method
+            super().__setitem__(key, value)
 
     def append(self, item: VT) -> None:
         """Override the append method of `list` to constrain the type of the appended value."""
-        if not self.is_valid(item):
+        if not self._check(item):
             raise TypeError(self.error_message(item))
         super().append(item)
 
+    def insert(self, index: SupportsIndex, item: VT) -> None:
+        """Override the insert method of `list` to constrain the type of the inserted value."""
+        if not self._check(item):
+            raise TypeError(self.error_message(item))
+        super().insert(index, item)
+
     def extend(self, other: Iterable[VT]) -> None:
         """Override the extend method of `list` to constrain the types of the extended values."""
-        for value in other:
-            if not self.is_valid(value):
-                raise TypeError(self.error_message(value))
-        super().extend(other)
+        super().extend(self._validated(other))
+
+    def extend_sampled(self, other: Iterable[VT], sample: int = 16) -> None:
+        """
+        Extend the list by checking the types of a random sample of the extended values only.
+
+        Arguments
+        ---------
+        other : Iterable[VT]
+            Values to add to the list.
+        sample : int, default=16
+            Maximum number of values to check.
+
+        Raises
+        ------
+        TypeError
+            If any of the sampled values is invalid.
+
+        Warning
+        -------
+        This method trades completeness for speed, like the default `BeartypeStrategy.O1` strategy
+        (see the module documentation). It should only be used for large payloads from trusted
+        sources with homogeneous elements: values outside of the sample are not checked, so that
+        erroneous mixed types might not be detected.
+        """
+        values = other if isinstance(other, (list, tuple)) else list(other)
+        check = self._check
+        for index in random.sample(range(len(values)), min(sample, len(values))):
+            if not check(values[index]):
+                raise TypeError(self.error_message(values[index]))
+        super().extend(values)
+
+    def __iadd__(self, other: Iterable[VT]) -> Self:  # type: ignore[override]
+        """Override the in-place concatenation of `list` to constrain the types of the values."""
+        self.extend(other)
+        return self
+
+    def _validated(self, values: Iterable[Any]) -> Iterable[Any]:
+        """
+        Check the types of several values at once.
+
+        Arguments
+        ---------
+        values : Iterable[Any]
+            Values to check. Iterators are consumed once and materialized as a list.
+
+        Returns
+        -------
+        Iterable[Any]
+            Values to insert, safe to iterate again.
+
+        Raises
+        ------
+        TypeError
+            If any value is invalid, reporting the first invalid one.
+
+        Notes
+        -----
+        Values held by another `TypeConstrainedList` whose type constraint is covered by the one
+        of this list (same hint, or subclasses of the allowed classes) have already been checked on
+        insertion, hence they are not checked again (see `hint_covers`).
+        """
+        if isinstance(values, TypeConstrainedList) and (
+            self.same_constraints(values) or hint_covers(self.value_type, values.value_type)
+        ):
+            return values
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        check = self._check
+        if not all(map(check, values)):  # iterate at C level in the common (valid) case
+            invalid = next(value for value in values if not check(value))
+            raise TypeError(self.error_message(invalid))
+        return values
+
+    def same_constraints(self, other: "TypeConstrainedList[Any]") -> bool:
+        """
+        Check if another constrained list has the same type constraint as this list.
+
+        Arguments
+        ---------
+        other : TypeConstrainedList
+            List to compare the type constraint with.
+
+        Returns
+        -------
+        bool
+            True if both lists are constrained by the same (or equal) type hints.
+        """
+        return other.value_type is self.value_type or other.value_type == self.value_type
 
     def error_message(self, item: Any) -> str:
         """Generate an error message for an invalid item."""
-        return error_message(item, self.value_type, spec="value")
+        return self._error_template % type(item).__name__
 
 
 # --- Type-Constrained Containers ------------------------------------------------------------------
 
 
-class TypeConstrainedDict(UserDict[KT, VT], Generic[KT, VT]):
+class TypeConstrainedDict(dict[KT, VT], Generic[KT, VT]):
     """
     Dictionary subclass that constrains the types of keys and values.
 
@@ -206,7 +629,7 @@ class TypeConstrainedDict(UserDict[KT, VT], Generic[KT, VT]):
     value_type : object
         Allowed type(s) for the dictionary values.
     data : Dict[KT, VT]
-        Underlying dictionary data, inherited from `UserDict`.
+        Initial items of the dictionary.
 
     Examples
     --------
@@ -232,11 +655,24 @@ class TypeConstrainedDict(UserDict[KT, VT], Generic[KT, VT]):
     >>> from typing import Union
     >>> d = TypeConstrainedDict(Union[str, int], Union[int, float], {'a': 1, 2: 2.0})
 
-    See Also
-    --------
-    collections.UserDict
+    Notes
+    -----
+    The class subclasses `dict` directly: reads (lookups, iteration, length...) are inherited from
+    the builtin type, and only the mutating methods are overridden to check the inserted items.
+    Copies and unions are returned as constrained dictionaries of the same class. The `data`
+    property is kept for compatibility with the former `UserDict` base, and returns the dictionary
+    itself.
     """
 
+    __slots__ = (
+        "key_type",
+        "value_type",
+        "_check_key",
+        "_check_value",
+        "_error_template_key",
+        "_error_template_value",
+    )
+
     def __init__(self, key_type: object, value_type: object, data: Optional[Dict[KT, VT]] = None):
         """
         Initialize the dictionary with the types of its keys and values.
@@ -250,35 +686,103 @@ class TypeConstrainedDict(UserDict[KT, VT], Generic[KT, VT]):
         data : Dict[KT, VT], optional
             Initial data to populate the dictionary with.
         """
-        self.key_type = key_type
-        self.value_type = value_type
+        self._constrain(key_type, value_type)
         super().__init__()  # initialize with empty dictionary
         if data:  # populate with initial data
             self.update(data)
 
+    def _constrain(self, key_type: object, value_type: object) -> None:
+        """Set the type constraints and the derived validators and error templates."""
+        self.key_type = key_type
+        self.value_type = value_type
+        self._check_key = make_validator(key_type)
+        self._check_value = make_validator(value_type)
+        self._error_template_key = error_template(key_type, spec="key")
+        self._error_template_value = error_template(value_type, spec="value")
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Get the state to pickle or copy: the type hints, from which the validators are rebuilt,
+        and the attributes added by subclasses (see `_extra_state`)."""
+        state = _extra_state(self, TypeConstrainedDict)
+        state["key_type"] = self.key_type
+        state["value_type"] = self.value_type
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """Restore the type constraints and the attributes of subclasses from a pickled or copied
+        state."""
+        for name, value in state.items():
+            if name not in ("key_type", "value_type"):
+                setattr(self, name, value)
+        self._constrain(state["key_type"], state["value_type"])
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Support pickling and copying: restore the constraints before re-inserting the items."""
+        return (_restore, (type(self), self.__getstate__()), None, None, iter(self.items()))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Self:
+        """
+        Create a deep copy of the dictionary without checking the copied items again.
+
+        Notes
+        -----
+        Copies of valid items are valid, so that they are inserted directly in the new dictionary.
+        Keys and values of immutable builtin types are shared rather than copied. Attributes added
+        by subclasses are deep copied.
+        """
+        clone = _restore(type(self), {"key_type": self.key_type, "value_type": self.value_type})
+        memo[id(self)] = clone
+        for name, value in _extra_state(self, TypeConstrainedDict).items():
+            setattr(clone, name, copy.deepcopy(value, memo))
+        keys = _deepcopy_items(self.keys(), _is_immutable_hint(self.key_type), memo)
+        values = _deepcopy_items(self.values(), _is_immutable_hint(self.value_type), memo)
+        dict.update(clone, zip(keys, values))
+        return clone
+
+    def copy(self) -> Self:
+        """Create a shallow copy of the dictionary, with the same type constraints."""
+        clone = _restore(type(self), self.__getstate__())
+        dict.update(clone, self)  # items already checked
+        return clone
+
+    def __or__(self, other: Mapping[KT, VT]) -> Self:  # type: ignore[override]
+        """Override the union of `dict` to return a dictionary with the same type constraints."""
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        clone = self.copy()
+        clone.update(other)
+        return clone
+
+    @property
+    def data(self) -> Dict[KT, VT]:
+        """Items of the dictionary (the dictionary itself)."""
+        return self
+
     def is_valid_key(self, key: Any) -> bool:
         """
         Check if the key is of the correct type, matched against the `key_type` attribute.
 
         See Also
         --------
-        beartype.door.is_bearable(obj: object, hint: object) -> bool
+        make_validator
         """
-        return is_bearable(key, self.key_type)
+        return self._check_key(key)
 
     def is_valid_value(self, value: Any) -> bool:
         """Check if the value is of the correct type, matched against the `value_type` attribute."""
-        return is_bearable(value, self.value_type)
+        return self._check_value(value)
 
     def __setitem__(self, key: KT, value: VT) -> None:
         """Override `dict` setter method to constrain the types of the assigned key and value."""
-        if not self.is_valid_key(key):
+        if not self._check_key(key):
             raise TypeError(self.error_message_key(key))
-        if not self.is_valid_value(value):
+        if not self._check_value(value):
             raise TypeError(self.error_message_value(value))
         super().__setitem__(key, value)
 
-    def update(self, other=(), /, **kwargs) -> None:
+    def update(  # type: ignore[override]
+        self, other: Mapping[KT, VT] | Iterable[Tuple[KT, VT]] = (), /, **kwargs: VT
+    ) -> None:
         """Override `dict` update method to constrain the types of the updated keys and values.
 
         Arguments
@@ -294,28 +798,80 @@ class TypeConstrainedDict(UserDict[KT, VT], Generic[KT, VT]):
             Original method documentation, using `overload` to provide various type signatures.
             See mypy issue  #1430.
         """
-        keys: Tuple[Any, ...] = ()  # initialize containers for keys and values to check
-        values: Tuple[Any, ...] = ()
-        if isinstance(other, dict):  # `other` is dict: check types for each (key, value) pair
-            keys += tuple(other.keys())
-            values += tuple(other.values())
-        elif isinstance(other, Iterable):  # `other` is iterable: check types for each pair
-            keys += tuple(k for k, _ in other)
-            values += tuple(v for _, v in other)
-        if kwargs:  # `kwargs` is dict: add keys and values to the existing ones
-            keys += tuple(kwargs.keys())
-            values += tuple(kwargs.values())
-        for key, value in zip(keys, values):
-            if not self.is_valid_key(key):
+        if isinstance(other, TypeConstrainedDict) and (
+            self.same_constraints(other)
+            or (
+                hint_covers(self.key_type, other.key_type)
+                and hint_covers(self.value_type, other.value_type)
+            )
+        ):  # already checked on insertion into `other`
+            self._check_items(kwargs)
+        else:
+            if not isinstance(other, Mapping):
+                other = dict(other)  # consume `other` once (it may be a one-shot iterator)
+            self._check_items(other)
+            self._check_items(kwargs)
+        super().update(other, **kwargs)  # builtin method, does not call `__setitem__`
+
+    def _check_items(self, items: Mapping[Any, Any]) -> None:
+        """
+        Check the types of several keys and values at once.
+
+        Raises
+        ------
+        TypeError
+            If any key or value is invalid, reporting the first invalid one.
+
+        Notes
+        -----
+        Keys and values are checked with `all` at C level, which is fast in the common case where
+        all of them are valid. Items are only iterated in Python to find the invalid one.
+        """
+        check_key, check_value = self._check_key, self._check_value
+        if all(map(check_key, items.keys())) and all(map(check_value, items.values())):
+            return
+        for key, value in items.items():
+            if not check_key(key):
                 raise TypeError(self.error_message_key(key))
-            if not self.is_valid_value(value):
+            if not check_value(value):
                 raise TypeError(self.error_message_value(value))
-        super().update(other, **kwargs)
+
+    def setdefault(self, key: KT, default: VT = None) -> VT:  # type: ignore[assignment]
+        """Override the `dict` setdefault method to constrain the types of the inserted key and
+        value."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __ior__(  # type: ignore[override]
+        self, other: Mapping[KT, VT] | Iterable[Tuple[KT, VT]]
+    ) -> Self:
+        """Override the in-place union of `dict` to constrain the types of the merged items."""
+        self.update(other)
+        return self
+
+    def same_constraints(self, other: "TypeConstrainedDict[Any, Any]") -> bool:
+        """
+        Check if another constrained dictionary has the same type constraints as this dictionary.
+
+        Arguments
+        ---------
+        other : TypeConstrainedDict
+            Dictionary to compare the type constraints with.
+
+        Returns
+        -------
+        bool
+            True if both dictionaries are constrained by the same (or equal) key and value hints.
+        """
+        return (other.key_type is self.key_type or other.key_type == self.key_type) and (
+            other.value_type is self.value_type or other.value_type == self.value_type
+        )
 
     def error_message_key(self, item: Any) -> str:
         """Generate an error message for an invalid key."""
-        return error_message(item, self.key_type, spec="key")
+        return self._error_template_key % type(item).__name__
 
     def error_message_value(self, item: Any) -> str:
         """Generate an error message for an invalid value."""
-        return error_message(item, self.value_type, spec="value")
+        return self._error_template_value % type(item).__name__
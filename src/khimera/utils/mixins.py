@@ -5,15 +5,258 @@ khimera.utils.mixins
 Mixin classes for common functionality in custom classes and objects with nested components.
 """
 import copy
-from typing import Self
+import types
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Optional, Self, Set, Tuple, TypeVar
 
-from deepdiff import DeepDiff
+T = TypeVar("T")
+
+_OPAQUE_TYPES = (
+    type,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.ModuleType,
+)
+"""Types whose instances are compared with their own equality (identity), not by attributes."""
+
+_ATOMIC_TYPES = frozenset(
+    {
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        type,
+        types.FunctionType,
+        types.BuiltinFunctionType,
+    }
+)
+"""Types whose instances are shared rather than copied by deep copies (immutable or opaque)."""
+
+_HASH_DEPTH = 6
+"""Number of levels of nested containers and objects explored by `_deep_hash`."""
+
+
+def _deep_equal(a: Any, b: Any, seen: Optional[Set[Tuple[int, int]]] = None) -> bool:
+    """
+    Compare two objects structurally, stopping at the first difference.
+
+    Arguments
+    ---------
+    a, b : Any
+        Objects to compare.
+    seen : Set[Tuple[int, int]], optional
+        Identifiers of the pairs of objects being compared by the enclosing calls.
+
+    Returns
+    -------
+    bool
+        True if the objects are deeply equal.
+
+    Notes
+    -----
+    Comparison rules, by type of the objects (which should be identical):
+
+    - Mappings: same keys, with deeply equal values.
+    - Lists and tuples: deeply equal items, regardless of their order.
+    - `DeepComparable` instances and objects without their own equality: deeply equal attributes.
+    - Other objects (builtin scalars, sets, functions, classes...): `==`.
+
+    A pair of objects met again while it is being compared (reference cycle) is considered equal
+    at this level, so that self-referencing structures are compared in finite time.
+    """
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    compare = _comparator(a)
+    if compare is None:
+        return bool(a == b)
+    seen = set() if seen is None else seen
+    pair = (id(a), id(b))
+    if pair in seen:  # cycle: the enclosing call compares the rest
+        return True
+    seen.add(pair)
+    try:
+        return compare(a, b, seen)
+    finally:
+        seen.discard(pair)  # only the pairs of the enclosing calls are kept
+
+
+def _comparator(a: Any) -> Optional[Callable[[Any, Any, Set[Tuple[int, int]]], bool]]:
+    """Select the function comparing an object structurally, or None to compare it with `==` (see
+    `_deep_equal`)."""
+    if isinstance(a, Mapping):
+        return _deep_equal_mapping
+    if isinstance(a, (list, tuple)):
+        return _deep_equal_unordered
+    if isinstance(a, _OPAQUE_TYPES) or not hasattr(a, "__dict__"):
+        return None
+    if _has_default_eq(type(a)):
+        return _deep_equal_attributes
+    return None
+
+
+def _has_default_eq(cls: type) -> bool:
+    """Check whether a class keeps the default equality (identity) or the one of
+    `DeepComparable`, rather than defining its own."""
+    eq: Callable[..., Any] = cls.__eq__
+    return eq is object.__eq__ or eq is DeepComparable.__eq__
+
+
+def _deep_equal_mapping(
+    a: Mapping[Any, Any], b: Mapping[Any, Any], seen: Set[Tuple[int, int]]
+) -> bool:
+    """Compare two mappings key-wise (see `_deep_equal`)."""
+    return len(a) == len(b) and all(
+        key in b and _deep_equal(value, b[key], seen) for key, value in a.items()
+    )
+
+
+def _deep_equal_attributes(a: Any, b: Any, seen: Set[Tuple[int, int]]) -> bool:
+    """Compare the attributes of two objects (see `_deep_equal`)."""
+    return _deep_equal_mapping(vars(a), vars(b), seen)
+
+
+def _deep_equal_unordered(
+    a: List[Any] | Tuple[Any, ...], b: List[Any] | Tuple[Any, ...], seen: Set[Tuple[int, int]]
+) -> bool:
+    """Compare two sequences item-wise regardless of the order of their items (see
+    `_deep_equal`)."""
+    if len(a) != len(b):
+        return False
+    if all(_deep_equal(x, y, seen) for x, y in zip(a, b)):  # common case: same order
+        return True
+    unmatched = list(b)
+    for x in a:
+        for i, y in enumerate(unmatched):
+            if _deep_equal(x, y, seen):
+                del unmatched[i]
+                break
+        else:
+            return False
+    return True
+
+
+def _deep_hash(a: Any, depth: int = _HASH_DEPTH) -> int:
+    """
+    Compute a hash consistent with `_deep_equal`: deeply equal objects have the same hash.
+
+    Arguments
+    ---------
+    a : Any
+        Object to hash.
+    depth : int
+        Number of levels of nested containers and objects to explore.
+
+    Returns
+    -------
+    int
+        Hash of the object, independent of the order of the items in nested lists and tuples.
+
+    Notes
+    -----
+    Objects nested deeper than `depth` are hashed by their type only. This bounds the cost of the
+    hash, and keeps it consistent with `_deep_equal` on reference cycles: equivalent cycles of
+    different lengths (e.g. an object referring to itself, and two objects referring to each other)
+    are equal, and their unrolling to any fixed depth is identical.
+    """
+    if depth <= 0:
+        return hash(type(a))
+    depth -= 1
+    if isinstance(a, Mapping):
+        items = frozenset((key, _deep_hash(value, depth)) for key, value in a.items())
+        return hash((type(a), items))
+    if isinstance(a, (list, tuple)):
+        return hash((type(a), tuple(sorted(_deep_hash(item, depth) for item in a))))
+    if isinstance(a, _OPAQUE_TYPES) or not _has_default_eq(type(a)):
+        try:
+            return hash(a)
+        except TypeError:  # unhashable object with its own equality
+            pass
+    if hasattr(a, "__dict__"):
+        return hash((type(a), _deep_hash(vars(a), depth)))
+    return hash(type(a))  # consistent but coarse fallback
+
+
+def _copies_by_dict(cls: type) -> bool:
+    """
+    Check whether the instances of a class can be copied from their instance dictionary alone (see
+    `_copy_instance`).
+
+    Returns
+    -------
+    bool
+        False if the class customizes its copies (`__deepcopy__`), its pickled state
+        (`__getstate__`, `__setstate__`, `__reduce__`, `__reduce_ex__`), or stores attributes in
+        slots, which `copy.deepcopy` honours but the instance dictionary does not carry. The slot
+        of `DeepHashable` is ignored, since it only caches the hash of the object.
+    """
+    return (
+        getattr(cls, "__deepcopy__", None) is None
+        and getattr(cls, "__setstate__", None) is None
+        and getattr(cls, "__getstate__") is object.__getstate__
+        and getattr(cls, "__reduce__") is object.__reduce__
+        and getattr(cls, "__reduce_ex__") is object.__reduce_ex__
+        and not any(
+            base.__dict__.get("__slots__") for base in cls.__mro__ if base is not DeepHashable
+        )
+    )
+
+
+def _copy_instance(obj: T, memo: Dict[int, Any]) -> T:
+    """
+    Create a deep copy of an object from its instance dictionary.
+
+    Arguments
+    ---------
+    obj : T
+        Object to copy, with a `__dict__` and without custom copy hooks (see `_copies_by_dict`).
+    memo : Dict[int, Any]
+        Memo dictionary of `copy.deepcopy`, shared with the copies of the attributes.
+
+    Returns
+    -------
+    T
+        New instance of the same class, whose attributes are shared with the original object if
+        they are atomic (see `_ATOMIC_TYPES`), and deep copies otherwise.
+
+    Notes
+    -----
+    The new object is registered in `memo` before its attributes are copied, so that references to
+    the original object from its attributes (cycles) are mapped to the copy.
+    """
+    new = object.__new__(type(obj))
+    memo[id(obj)] = new
+    state = new.__dict__
+    for key, value in obj.__dict__.items():
+        state[key] = value if type(value) in _ATOMIC_TYPES else copy.deepcopy(value, memo)
+    return new
 
 
 class DeepCopyable:
     """
     Mixin class for creating deep copies of objects.
 
+    Notes
+    -----
+    The object itself is copied from its instance dictionary (see `_copy_instance`), instead of
+    going through the generic `__reduce_ex__` protocol of `copy.deepcopy`. Nested objects are copied
+    by `copy.deepcopy`.
+
+    Classes which define their own `__deepcopy__`, pickled state (`__getstate__`, `__setstate__`,
+    `__reduce__`, `__reduce_ex__`) or slots are copied by `copy.deepcopy` instead, which calls
+    their `__deepcopy__` if any (see `_copies_by_dict`).
+
+    Implementation
+    --------------
+    The fast path is provided by `copy` rather than by a `__deepcopy__` method: as a public
+    attribute of the classes, `__deepcopy__` would be exposed by mocks specified from them (e.g.
+    `Mock(spec=Plugin)`), which would then return a child mock when copied.
+
     See Also
     --------
     copy.deepcopy
@@ -21,6 +264,8 @@ class DeepCopyable:
 
     def copy(self) -> Self:
         """Create a deep copy of the object, creating copies of all its nested components."""
+        if _copies_by_dict(type(self)):
+            return _copy_instance(self, {})
         return copy.deepcopy(self)
 
 
@@ -28,14 +273,67 @@ class DeepComparable:
     """
     Mixin class for comparing objects by deep comparison.
 
-    See Also
-    --------
-    deepdiff.DeepDiff
+    Notes
+    -----
+    Objects are equal if they are instances of the same class and if their attributes are deeply
+    equal, regardless of the order of the items in nested lists and tuples (see `_deep_equal`). The
+    comparison stops at the first difference.
     """
 
     def __eq__(self, other):
         """Compare the object with another object by deep comparison."""
         if not isinstance(other, self.__class__):
             return False
-        diff = DeepDiff(self.__dict__, other.__dict__, ignore_order=True)
-        return not diff  # True if no differences
+        return _deep_equal_attributes(self, other, {(id(self), id(other))})
+
+
+class DeepHashable:
+    """
+    Mixin class for hashing objects consistently with the `DeepComparable` mixin.
+
+    The hash is computed from the attributes of the object (see `_deep_hash`) at the first call to
+    `hash`, and cached until an attribute of the object is set or deleted.
+
+    This mixin should precede `DeepComparable` in the bases of a class, since defining `__eq__`
+    in `DeepComparable` implicitly sets its `__hash__` to None.
+
+    Warning
+    -------
+    Objects combining `DeepComparable` and `DeepHashable` should be treated as immutable once they
+    are hashed: in-place mutations of nested attributes (e.g. appending to a list attribute) are
+    not detected and leave a stale hash. Such objects should not be mutated at all while they are
+    used as dictionary keys or set members, since they would no longer be found under their new
+    hash.
+
+    Implementation
+    --------------
+    The cached hash is stored in a slot rather than in the instance dictionary, so that it is
+    ignored by the comparison and the hash of the attributes, and is not copied by `DeepCopyable`.
+
+    Examples
+    --------
+    >>> class Point(DeepHashable, DeepComparable):
+    ...     def __init__(self, x, y):
+    ...         self.x, self.y = x, y
+    >>> len({Point(1, 2), Point(1, 2)})
+    1
+    """
+
+    __slots__ = ("_hash",)
+    _hash: Optional[int]
+
+    def __hash__(self) -> int:
+        """Hash the object from its attributes, or return the cached hash."""
+        cached: Optional[int] = getattr(self, "_hash", None)  # unset before the first hash
+        if cached is None:
+            cached = self._hash = _deep_hash(vars(self))
+        return cached
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "_hash":
+            object.__setattr__(self, "_hash", None)  # invalidate the cached hash
+
+    def __delattr__(self, name: str) -> None:
+        super().__delattr__(name)
+        object.__setattr__(self, "_hash", None)  # invalidate the cached hash
@@ -3,6 +3,84 @@ conftest
 ========
 
 Configuration file for pytest.
+
+Notes
+-----
+The environment is configured before any test module imports `typer`, so that the CLI tests render
+help messages with the plain Click formatter instead of the Rich one (styled panels and tables are
+not checked by the tests and are costly to build). Explicit settings in the environment take
+precedence.
+
+When the tests are distributed over several workers with `pytest-xdist` (`pytest -n auto
+--dist loadgroup`), the tests of each module are grouped in the same worker (see
+`pytest_collection_modifyitems`).
 """
 
+import os
+from typing import Optional
+from unittest.mock import Mock
+
 import pytest
+
+from khimera.plugins.create import Plugin
+from khimera.plugins.declare import PluginModel
+
+os.environ.setdefault("TYPER_USE_RICH", "0")  # read by `typer.core` at import
+os.environ.setdefault("NO_COLOR", "1")
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Group the tests of each module in a single `pytest-xdist` worker, unless they are already
+    assigned to a group.
+
+    Notes
+    -----
+    With `--dist loadgroup`, modules are distributed over the workers as a whole, so that their
+    module-scoped fixtures are built once instead of once per worker running their tests. Explicit
+    `xdist_group` markers take precedence (e.g. to keep tests mutating shared state together). The
+    marker has no effect when `pytest-xdist` is not used.
+    """
+    for item in items:
+        module = getattr(item, "module", None)
+        if module is not None and item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(module.__name__))
+
+
+# --- Shared Fixtures ------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def make_plugin():
+    """
+    Factory of mock `Plugin` instances with a specified name, version, and optional model.
+
+    Returns
+    -------
+    Callable[[str, str, Optional[PluginModel]], Plugin]
+        Function creating a mocked plugin instance, with arguments:
+
+        - `name` (str): Name of the plugin.
+        - `version` (str, default="1.0.0"): Version of the plugin.
+        - `model` (PluginModel, optional): Plugin model associated with the plugin.
+
+    Notes
+    -----
+    The fixture is session-scoped so that module-scoped fixtures can build their plugins with it.
+    Mocks are created directly from `unittest.mock` rather than with the `mocker` fixture, which
+    is only needed to undo patches.
+
+    Warning
+    -------
+    The `name` attribute is set *after* creating the mock, since the `name` keyword argument of
+    the `Mock` constructor names the mock itself.
+    """
+
+    def _make(name: str, version: str = "1.0.0", model: Optional[PluginModel] = None) -> Plugin:
+        plugin = Mock(spec=Plugin)
+        plugin.name = name
+        plugin.version = version
+        plugin.model = model
+        return plugin
+
+    return _make
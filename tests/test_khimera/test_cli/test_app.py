@@ -14,16 +14,21 @@ khimera.cli.app.CliApp
 # pylint: disable=redefined-outer-name
 #   Reason: Pytest fixtures require redefinition of variables.
 
+from typing import Tuple
+
 import pytest
 import typer
 from typer.testing import CliRunner
 
 from khimera.cli.app import CliApp
 
+pytestmark = pytest.mark.xdist_group("cli")  # build the session-scoped CLIs in a single worker
+
+
 # --- Fixtures -------------------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_command():
     """Factory for a sample command function."""
 
@@ -33,6 +38,56 @@ def sample_command():
     return _factory
 
 
+@pytest.fixture(scope="session")
+def precompiled_cmd(sample_command):
+    """Click command compiled once from a CLI application with a registered command, to inspect
+    the registration without running the Typer build pipeline in each test."""
+    cli = CliApp()
+    cli.add_command("test-cmd", sample_command)
+    return typer.main.get_command(cli)
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Typer testing runner, shared by the tests of the module."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def blank_cli():
+    """CLI application without any group nor command, shared by the tests which only invoke it
+    (not to be modified by the tests)."""
+    return CliApp()
+
+
+@pytest.fixture
+def cli():
+    """Fresh CLI application for a test (to be modified by the test)."""
+    return CliApp()
+
+
+@pytest.fixture(scope="module")
+def invoke_blank(runner, blank_cli):
+    """
+    Invoke the blank CLI application.
+
+    Returns
+    -------
+    Callable[[Tuple[str, ...]], Result]
+        Function invoking the blank CLI with a tuple of arguments.
+
+    Notes
+    -----
+    Tests which register groups or commands build their own application and invoke it directly
+    with the runner.
+    """
+
+    def _invoke(args: Tuple[str, ...] = ()):
+        return runner.invoke(blank_cli, list(args))
+
+    return _invoke
+
+
 # --- Tests for CLI Initialization and Attributes --------------------------------------------------
 
 
@@ -76,40 +131,35 @@ def test_no_args_is_help_enforced(app):
 # --- Tests for Command Group Management -----------------------------------------------------------
 
 
-def test_add_group_new():
+def test_add_group_new(cli):
     """Ensure command groups can be created and retrieved with no sub-group instance."""
-    cli = CliApp()
     group = cli.add_group("test-group")
     assert cli.has_group("test-group"), "Command group 'test-group' not registered"
     assert cli.get_group("test-group") is group, "Retrieved group != registered instance"
 
 
-def test_add_group_existing():
+def test_add_group_existing(cli):
     """Ensure command groups can be created and retrieved from an existing sub-group instance."""
-    cli = CliApp()
     sub_app = CliApp()
     cli.add_group("test-group", sub_app)
     assert cli.has_group("test-group"), "Command group 'test-group' not registered"
-    assert cli.get_group("test-group") is sub_app, "Retrieved group =! registered instance"
+    assert cli.get_group("test-group") is sub_app, "Retrieved group != registered instance"
 
 
-def test_duplicate_group():
+def test_duplicate_group(cli):
     """Ensure that adding a duplicate group is prevented."""
-    cli = CliApp()
     cli.add_group("test-group")
     with pytest.raises(ValueError, match="Command group 'test-group' already exists."):
         cli.add_group("test-group")
 
 
-def test_get_non_existent_group():
+def test_get_non_existent_group(cli):
     """Ensure retrieving a non-existent group returns None."""
-    cli = CliApp()
     assert cli.get_group("unknown") is None, "Non-existent group should return None"
 
 
-def test_nested_groups():
+def test_nested_groups(cli):
     """Ensure nested command groups are correctly registered and accessible."""
-    cli = CliApp()
     group = cli.add_group("test-group")
     sub_group = group.add_group("test-sub-group")
     assert group.has_group("test-sub-group"), "Subgroup 'test-sub-group' not in 'test-group'"
@@ -119,31 +169,32 @@ def test_nested_groups():
 # --- Tests for Command Registration ---------------------------------------------------------------
 
 
-def test_register_command_main(sample_command):
+def test_register_command_main(cli, sample_command):
     """Ensure commands can be registered dynamically in the main CLI."""
-    cli = CliApp()
     cli.add_command("test-cmd", sample_command)
     assert cli.has_command("test-cmd"), "Command 'test-cmd' not registered"
 
 
-def test_register_command_in_group(sample_command):
+def test_register_command_in_group(cli, sample_command):
     """Ensure commands can be registered inside a command group."""
-    cli = CliApp()
     group = cli.add_group("test-group")
     group.add_command("test-cmd", sample_command)
     assert group.has_command("test-cmd"), "Command 'test-cmd' not registered in 'test-group'"
 
 
-def test_register_command_non_existent_group(sample_command):
+def test_register_command_compiled(precompiled_cmd):
+    """Ensure registered commands are exposed by the compiled Click command."""
+    assert "test-cmd" in precompiled_cmd.commands, "Command 'test-cmd' not compiled"
+
+
+def test_register_command_non_existent_group(cli, sample_command):
     """Ensure that a command cannot be registered in a non-existent group."""
-    cli = CliApp()
     with pytest.raises(ValueError, match="Command group 'unknown' not found."):
         cli.add_command("test-cmd", sample_command, in_group="unknown")
 
 
-def test_duplicate_command_registration(sample_command):
+def test_duplicate_command_registration(cli, sample_command):
     """Ensure that registering a duplicate command is prevented."""
-    cli = CliApp()
     cli.add_command("test-cmd", sample_command)
     with pytest.raises(ValueError, match="Command 'test-cmd' already exists."):
         cli.add_command("test-cmd", sample_command)
@@ -151,55 +202,53 @@ def test_duplicate_command_registration(sample_command):
 
 # --- Tests for CLI Execution ----------------------------------------------------------------------
 
-runner = CliRunner()  # Typer testing runner
-
 
-def test_cli_invocation():
+def test_cli_invocation(invoke_blank):
     """Test that the CLI can be invoked with no argument."""
-    cli = CliApp()
-    result = runner.invoke(cli)
+    result = invoke_blank()
     assert not result.exit_code, "CLI invocation with no argument failed (O exit code)"
 
 
-def test_cli_help():
+def test_cli_help(cli):
     """
     Test that the CLI displays help information (should be automatically provided by `Typer`).
+
+    Notes
+    -----
+    The help message is formatted directly from a context of the compiled command, without
+    invoking the application through the runner.
     """
-    cli = CliApp()
-    result = runner.invoke(cli, ["--help"])
-    assert not result.exit_code, "`help` invocation failed (O exit code)"
+    command = typer.main.get_command(cli)
+    help_text = command.get_help(typer.Context(command, info_name="test"))
+    assert "Usage: test" in help_text, "`help` message not generated"
 
 
-def test_unknown_command():
+def test_unknown_command(invoke_blank):
     """Ensure unknown commands return an error message."""
-    cli = CliApp()
-    result = runner.invoke(cli, ["unknown-command"])
+    result = invoke_blank(("unknown-command",))
     assert result.exit_code, "Unknown command invocation did not return a O exit code"
 
 
-def test_command_execution(sample_command):
+def test_command_execution(cli, runner, sample_command):
     """Ensure a command registered in the main CLI executes properly."""
-    cli = CliApp()
     cli.add_command("test-cmd", sample_command)
-    result = runner.invoke(cli, ["test-cmd"])
+    result = runner.invoke(cli, ["test-cmd"], catch_exceptions=False)
     assert not result.exit_code, "Command execution failed (O exit code)"
     assert "Success" in result.output, "Expected output not found"
 
 
-def test_group_command_execution(sample_command):
+def test_group_command_execution(cli, runner, sample_command):
     """Ensure a command registered inside a group executes properly."""
-    cli = CliApp()
     group = cli.add_group("test-group")
     group.add_command("test-cmd", sample_command)
-    result = runner.invoke(cli, ["test-group", "test-cmd"])
+    result = runner.invoke(cli, ["test-group", "test-cmd"], catch_exceptions=False)
     assert not result.exit_code, "Group command execution failed (O exit code)"
     assert "Success" in result.output, "Expected output not found"
 
 
-def test_cli_groups_documented():
+def test_cli_groups_documented(cli):
     """Ensure high-level command groups are documented in the help output."""
-    cli = CliApp()
-    group = cli.add_group("test-group", help_msg="Test group")
-    result = runner.invoke(cli, ["--help"])
-    assert not result.exit_code, "Help command failed (O exit code)"
-    assert "test-group" in result.output, "Command group 'test-group' missing from help output"
+    cli.add_group("test-group", help_msg="Test group")
+    command = typer.main.get_command(cli)
+    help_text = command.get_help(typer.Context(command, info_name="test"))
+    assert "test-group" in help_text, "Command group 'test-group' missing from help output"
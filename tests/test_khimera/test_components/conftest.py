@@ -0,0 +1,46 @@
+"""
+test_khimera.test_components.conftest
+=====================================
+
+Shared fixtures for the tests of the components.
+"""
+
+import importlib.util
+import sys  # for registering the mock package in sys.modules
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def installed_mock_package(tmp_path_factory: pytest.TempPathFactory):
+    """
+    Simulate an installed package, built once for the test session.
+
+    Yields
+    ------
+    SimpleNamespace
+        Details of the installed package: `name` (package name) and `path` (directory of the
+        package, in which the tests write the resource files they need).
+
+    Notes
+    -----
+    The installation is simulated by building a package module whose spec points at a temporary
+    directory (origin and submodule search location), and registering it in `sys.modules` so that
+    `importlib.resources` resolves it as if it had been imported. No `__init__.py` file nor
+    `sys.path` entry is needed: the resource reader of the file loader only relies on the location
+    of the spec.
+
+    The package is shared by all the tests of the session, which only add resource files to its
+    directory. At the end of the session, the module is removed from `sys.modules`.
+    """
+    package = SimpleNamespace(name="test_package", path=tmp_path_factory.mktemp("test_package"))
+    # Simulate installation by registering an in-memory module located in the temporary directory
+    spec = importlib.util.spec_from_file_location(
+        package.name,
+        package.path / "__init__.py",
+        submodule_search_locations=[str(package.path)],
+    )
+    sys.modules[package.name] = importlib.util.module_from_spec(spec)
+    yield package
+    sys.modules.pop(package.name, None)
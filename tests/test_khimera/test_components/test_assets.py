@@ -11,16 +11,26 @@ khimera.components.assets
 # --- Silenced Errors ---
 # pylint: disable=unused-variable
 #   Test functions are used, but pylint does not detect it.
+# pylint: disable=redefined-outer-name
+#   Pytest fixtures require redefinition of variables.
 
 from pathlib import Path
-import sys  # for manipulating sys.path
-import shutil  # for copying directories
 
 import pytest
 
 from khimera.components.assets import Asset, AssetSpec
 
 
+# --- Fixtures -------------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def base_asset_spec():
+    """Asset specification admitting text and PDF files, shared by the validation tests of the
+    module (not to be modified by the tests)."""
+    return AssetSpec(name="test_spec", file_ext=(".txt", ".pdf"))
+
+
 # --- Tests for Asset (Component) ------------------------------------------------------------------
 
 
@@ -50,67 +60,54 @@ def test_asset_from_caller_uses_call_site_module():
     assert asset.package == __name__
 
 
-@pytest.mark.parametrize(
-    "file_path, package",
-    [
+def test_asset_initialization_various_paths():
+    """Test initialization of `Asset` with various file paths and package."""
+    for file_path, package in [
         ("assets/image.png", "my_package"),
         ("config.json", "my_package.resources"),
-    ],
-)
-def test_asset_initialization_various_paths(file_path, package):
-    """Test initialization of `Asset` with various file paths and package."""
-    asset = Asset(name="test_asset", file_path=file_path, package=package)
-    assert asset.file_path == file_path
-    assert asset.package == package
+    ]:
+        asset = Asset(name="test_asset", file_path=file_path, package=package)
+        assert asset.file_path == file_path, f"file_path={file_path!r}"
+        assert asset.package == package, f"package={package!r}"
 
 
 # --- Tests for Asset.get_path() method ------------------------------------------------------------
 
 
-def test_asset_get_path_installed_package(tmp_path: Path):
+@pytest.mark.xdist_group("sysmodules")  # mutates `sys.modules`
+@pytest.mark.parametrize(
+    "file_name, content",
+    [
+        ("test_file.txt", "Test content"),
+        ("test_data.json", '{"key": "value"}'),
+        ("test_file_empty.txt", ""),
+    ],
+)
+def test_asset_get_path_installed_package(installed_mock_package, file_name, content):
     """
     Test the `Asset.get_path()` method for an installed package.
 
-    Notes
-    -----
-    This test simulates the installation of a package by:
-
-    1. Creating a mock package structure in a temporary directory provided by the `tmp_path`
-       fixture. This basic package structure includes an `__init__.py` file and a test file.
-    2. Copying the package to a temporary site-packages directory.
-    3. Adding the site-packages directory to `sys.path` so that the package can be imported.
+    Test cases:
 
-    At the end of the test:
+    1. Text file.
+    2. File with another extension.
+    3. Empty file.
 
-    - The temporary directory is automatically cleaned up by the `tmp_path` fixture.
-    - The temporary site-packages directory is manually removed from `sys.path`.
+    See Also
+    --------
+    installed_mock_package
+        Fixture simulating the installation of the package, shared by the test cases which only
+        write their resource file in it.
     """
-    # Package and file details
-    package_name = "test_package"
-    file_name = "test_file.txt"
-    file_content = "Test content"
-    # Create a mock package structure
-    package_dir = tmp_path / package_name
-    package_dir.mkdir()
-    (package_dir / "__init__.py").touch()
-    (package_dir / file_name).write_text(file_content)
-    # Simulate installation by copying the package to a temporary site-packages directory
-    site_packages_dir = tmp_path / "site-packages"
-    site_packages_dir.mkdir()
-    installed_package_dir = site_packages_dir / package_name
-    shutil.copytree(package_dir, installed_package_dir)
-    # Add the site-packages directory to sys.path
-    sys.path.insert(0, str(site_packages_dir))
-    try:  # Create an asset and get the path with a context manager
-        asset = Asset(name="test_asset", file_path=file_name, package=package_name)
-        with asset.get_path() as path:
-            assert isinstance(path, Path)
-            assert path.name == file_name
-            assert path.read_text() == file_content
-            assert path.exists(), "Resource file does not exist."
-            assert path.is_file(), "Resource is not a file."
-    finally:  # Clean up
-        sys.path.pop(0)
+    package = installed_mock_package
+    (package.path / file_name).write_text(content)
+    asset = Asset(name="test_asset", file_path=file_name, package=package.name)
+    with asset.get_path() as path:  # get the path with a context manager
+        assert isinstance(path, Path)
+        assert path.name == file_name
+        assert path.read_text() == content
+        assert path.exists(), "Resource file does not exist."
+        assert path.is_file(), "Resource is not a file."
 
 
 # --- Tests for AssetSpec (FieldSpec) -----------------------------------------------------------
@@ -145,21 +142,27 @@ def test_asset_spec_initialization_defaults():
     assert asset_spec.unique is True
 
 
+def test_asset_spec_file_ext_normalized():
+    """Test that `AssetSpec` extensions are stored with a leading dot."""
+    asset_spec = AssetSpec(name="test_spec", file_ext=("txt", ".pdf"))
+    assert asset_spec.file_ext == (".txt", ".pdf")
+    asset_spec.file_ext = None
+    assert asset_spec.file_ext is None
+
+
 # --- Tests for AssetSpec validation ---------------------------------------------------------------
 
 
-def test_asset_spec_validate_valid_extension():
+def test_asset_spec_validate_valid_extension(base_asset_spec):
     """Test `AssetSpec` validation with valid extension."""
-    asset_spec = AssetSpec(name="test_spec", file_ext=(".txt", ".pdf"))
     asset = Asset(name="test_asset", file_path="test.txt", package="test_package")
-    assert asset_spec.validate(asset) is True
+    assert base_asset_spec.validate(asset) is True
 
 
-def test_asset_spec_validate_invalid_extension():
+def test_asset_spec_validate_invalid_extension(base_asset_spec):
     """Test `AssetSpec` validation with invalid extension."""
-    asset_spec = AssetSpec(name="test_spec", file_ext=(".txt", ".pdf"))
     asset = Asset(name="test_asset", file_path="test.png", package="test_package")
-    assert asset_spec.validate(asset) is False
+    assert base_asset_spec.validate(asset) is False
 
 
 def test_asset_spec_validate_no_extension_restriction():
@@ -167,3 +170,33 @@ def test_asset_spec_validate_no_extension_restriction():
     asset_spec = AssetSpec(name="test_spec")
     asset = Asset(name="test_asset", file_path="test.any", package="test_package")
     assert asset_spec.validate(asset) is True
+
+
+@pytest.mark.parametrize(
+    "file_ext, file_path, expected",
+    [
+        (("txt",), "test.txt", True),
+        ((".tar.gz",), "archive.tar.gz", True),
+        ((".tar.gz",), "archive.gz", False),
+        ((".txt",), "assets/test", False),
+        ((".bashrc",), ".bashrc", True),
+        (("bashrc",), "config/.bashrc", True),
+        ((".bashrc",), ".profile", False),
+    ],
+)
+def test_asset_spec_validate_extension_formats(file_ext, file_path, expected):
+    """Test `AssetSpec` validation with undotted and compound extensions, and dotfile names."""
+    asset_spec = AssetSpec(name="test_spec", file_ext=file_ext)
+    asset = Asset(name="test_asset", file_path=file_path, package="test_package")
+    assert asset_spec.validate(asset) is expected
+
+
+def test_asset_spec_validate_after_reassignment(base_asset_spec):
+    """Test that `AssetSpec` validation follows reassigned file paths and extensions."""
+    asset = Asset(name="test_asset", file_path="test.png", package="test_package")
+    assert base_asset_spec.validate(asset) is False
+    asset.file_path = "test.txt"
+    assert base_asset_spec.validate(asset) is True
+    asset_spec = AssetSpec(name="test_spec", file_ext=(".txt",))
+    asset_spec.file_ext = (".png",)
+    assert asset_spec.validate(asset) is False
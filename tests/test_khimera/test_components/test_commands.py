@@ -11,6 +11,8 @@ khimera.components.commands
 # --- Silenced Errors ---
 # pylint: disable=unused-variable
 #   Test functions are used, but pylint does not detect it.
+# pylint: disable=redefined-outer-name
+#   Pytest fixtures require redefinition of variables.
 # pylint: disable=unused-import
 #   Pytest is imported for testing while not explicitly used in this module.
 
@@ -19,6 +21,16 @@ import pytest
 from khimera.components.commands import Command, CommandSpec
 
 
+# --- Fixtures -------------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def base_command_spec():
+    """Command specification with two known groups, admitting new groups and top-level commands,
+    shared by the validation tests of the module (not to be modified by the tests)."""
+    return CommandSpec(name="test_spec", groups={"group1", "group2"})
+
+
 # --- Tests for Command (Component) ----------------------------------------------------------------
 
 
@@ -94,20 +106,17 @@ def test_command_spec_initialization_defaults():
 # --- Tests for CommandSpec validation -------------------------------------------------------------
 
 
-def test_command_spec_validate_valid_group():
+def test_command_spec_validate_valid_group(base_command_spec):
     """Test `CommandSpec` validation with a valid group."""
-    command_spec = CommandSpec(name="test_spec", groups={"group1", "group2"})
     command = Command(name="test_command", func=lambda: None, group="group1")
-    assert command_spec.validate(command) is True
+    assert base_command_spec.validate(command) is True
 
 
-def test_command_spec_validate_new_group():
+def test_command_spec_validate_new_group(base_command_spec):
     """Test `CommandSpec` validation with a new group."""
-    command_spec = CommandSpec(
-        name="test_spec", groups={"group1", "group2"}, admits_new_groups=True
-    )
+    assert base_command_spec.admits_new_groups is True
     command = Command(name="test_command", func=lambda: None, group="new_group")
-    assert command_spec.validate(command) is True
+    assert base_command_spec.validate(command) is True
 
 
 def test_command_spec_validate_new_group_not_allowed():
@@ -138,3 +147,43 @@ def test_command_spec_validate_empty_groups():
     command_spec = CommandSpec(name="test_spec")
     command = Command(name="test_command", func=lambda: None, group="new_group")
     assert command_spec.validate(command) is True
+
+
+@pytest.mark.parametrize(
+    "admits_top_level, admits_new_groups, group, expected",
+    [
+        (True, True, None, True),
+        (True, True, "new_group", True),
+        (True, False, None, False),
+        (True, False, "group1", True),
+        (True, False, "new_group", False),
+        (False, True, None, False),
+        (False, True, "new_group", True),
+        (False, False, None, False),
+        (False, False, "group1", True),
+        (False, False, "new_group", False),
+    ],
+)
+def test_command_spec_validate_flags(admits_top_level, admits_new_groups, group, expected):
+    """Test `CommandSpec` validation for all combinations of the group flags."""
+    command_spec = CommandSpec(
+        name="test_spec",
+        groups={"group1"},
+        admits_top_level=admits_top_level,
+        admits_new_groups=admits_new_groups,
+    )
+    command = Command(name="test_command", func=lambda: None, group=group)
+    assert command_spec.validate(command) is expected
+
+
+def test_command_spec_validate_flags_set_after_init():
+    """Test that `CommandSpec` validation follows the group flags set after initialization."""
+    command_spec = CommandSpec(name="test_spec", groups={"group1"})
+    top_level = Command(name="top_level", func=lambda: None)
+    new_group = Command(name="new_group", func=lambda: None, group="new_group")
+    assert command_spec.validate(top_level) is True
+    command_spec.admits_top_level = False
+    assert command_spec.validate(top_level) is False
+    assert command_spec.validate(new_group) is True
+    command_spec.admits_new_groups = False
+    assert command_spec.validate(new_group) is False
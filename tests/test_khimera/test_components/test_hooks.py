@@ -11,16 +11,64 @@ khimera.components.hooks
 # --- Silenced Errors ---
 # pylint: disable=unused-variable
 #   Test functions are used, but pylint does not detect it.
+# pylint: disable=redefined-outer-name
+#   Pytest fixtures require redefinition of variables.
 # pylint: disable=unused-import
 #   Pytest is imported for testing while not explicitly used in this module.
 # pylint: disable=unused-argument
 #   Sample test functions admit arguments that are not used.
 
+from collections import OrderedDict
+import gc
+import weakref
 from typing import Dict, Any
 
 import pytest
 
-from khimera.components.hooks import Hook, HookSpec
+from khimera.components.hooks import Hook, HookSpec, describe_hook
+
+
+# --- Fixtures -------------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def base_hook_spec():
+    """Hook specification expecting two arguments `(arg1: str, arg2: int)` and a boolean output,
+    shared by the validation tests of the module (not to be modified by the tests)."""
+    return HookSpec(name="test_spec", arg_types={"arg1": str, "arg2": int}, return_type=bool)
+
+
+# --- Sample Hook Functions -----------------------------------------------------------------------
+
+
+def valid_hook(arg1: str, arg2: int) -> bool:
+    """Hook matching the base specification."""
+    return True
+
+
+def invalid_types_hook(arg1: int, arg2: str) -> bool:
+    """Hook with swapped argument types."""
+    return True
+
+
+def unannotated_hook(arg1, arg2):
+    """Hook without type annotations."""
+    return True
+
+
+def extra_parameter_hook(arg1: str, arg2: int, extra: float) -> bool:
+    """Hook with an additional parameter."""
+    return True
+
+
+def missing_parameter_hook(arg1: str) -> bool:
+    """Hook with a missing parameter."""
+    return True
+
+
+def invalid_output_hook(arg1: str, arg2: int) -> str:
+    """Hook with an invalid return type."""
+    return "True"
 
 
 # --- Tests for Hook (Component) -------------------------------------------------------------------
@@ -40,6 +88,66 @@ def test_hook_initialization():
     assert hook.description == description
 
 
+def test_hook_signature_described():
+    """Test that `Hook` describes the signature of its function."""
+
+    def sample_hook(arg1: str, *args, key: int, **kwargs) -> bool:
+        return True
+
+    hook = Hook(name="test_hook", func=sample_hook)
+    assert [param.name for param in hook.signature.positional] == ["arg1"]
+    assert hook.signature.keyword_only == ("key",)
+    assert hook.signature.has_var_positional is True
+    assert hook.signature.has_var_keyword is True
+    assert hook.signature.return_annotation is bool
+
+
+def test_hook_signature_follows_function(base_hook_spec):
+    """Test that the signature of a hook, and its validation, follow a reassignment of its
+    function."""
+    hook = Hook(name="test_hook", func=valid_hook)
+    assert base_hook_spec.validate(hook) is True
+    hook.func = missing_parameter_hook
+    assert [param.name for param in hook.signature.positional] == ["arg1"]
+    assert base_hook_spec.validate(hook) is False
+
+
+def test_hook_signature_shared_between_hooks():
+    """Test that hooks wrapping the same function share a single description of its signature."""
+    hook1 = Hook(name="hook1", func=valid_hook)
+    hook2 = Hook(name="hook2", func=valid_hook)
+    assert hook1.signature is hook2.signature
+    assert describe_hook(valid_hook) is hook1.signature
+
+
+def test_hook_signature_released_with_function():
+    """Test that the cached description of a hook function does not outlive the function."""
+
+    def temp_hook(arg1: str) -> bool:
+        return True
+
+    assert describe_hook(temp_hook) is describe_hook(temp_hook)  # cached
+    ref = weakref.ref(temp_hook)
+    del temp_hook
+    gc.collect()
+    assert ref() is None  # not kept alive by the cache
+
+
+def test_hook_signature_uncached_callables():
+    """Test that `Hook` describes callables which are not introspectable or not hashable."""
+
+    class Unhashable:  # unhashable callable, described without the cache
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, arg1: str, arg2: int) -> bool:
+            return True
+
+    assert Hook(name="builtin", func=type).signature is None  # no signature for `type`
+    assert Hook(name="builtin", func=len).signature is not None  # no weak reference to `len`
+    hook = Hook(name="unhashable", func=Unhashable())
+    assert [param.name for param in hook.signature.positional] == ["arg1", "arg2"]
+
+
 # --- Tests for HookSpec (FieldSpec) ------------------------------------------------------------
 
 
@@ -67,22 +175,40 @@ def test_hook_spec_initialization():
     assert hook_spec.description == description
 
 
-def test_hook_spec_validate_valid_hook():
-    """Test `HookSpec` validation with a valid hook."""
-
-    def valid_hook(arg1: str, arg2: int) -> bool:
-        return True
-
-    hook_spec = HookSpec(name="test_spec", arg_types={"arg1": str, "arg2": int}, return_type=bool)
-    hook = Hook(name="valid_hook", func=valid_hook)
-    assert hook_spec.validate(hook) is True
+@pytest.mark.parametrize(
+    "func, expected",
+    [
+        (valid_hook, True),
+        (invalid_types_hook, False),
+        (unannotated_hook, False),
+        (extra_parameter_hook, False),
+        (missing_parameter_hook, False),
+        (invalid_output_hook, False),
+    ],
+    ids=["valid", "bad-types", "no-annotation", "extra-param", "missing-param", "bad-return"],
+)
+def test_hook_spec_validate(base_hook_spec, func, expected):
+    """
+    Test `HookSpec` validation against the base specification.
+
+    Test cases:
+
+    1. Valid hook.
+    2. Invalid input types.
+    3. Missing type annotations.
+    4. Extra parameter.
+    5. Missing parameter.
+    6. Invalid output type.
+    """
+    hook = Hook(name=func.__name__, func=func)
+    assert base_hook_spec.validate(hook) is expected
 
 
 # --- Tests for Input Types ------------------------------------------------------------------------
 
 
-def test_hook_spec_validate_invalid_input_types():
-    """Test `HookSpec` validation with invalid input types."""
+def test_hook_spec_validate_reordered_input_types():
+    """Test `HookSpec` validation with argument types declared in another order than the hook."""
 
     def invalid_hook(arg1: int, arg2: str) -> bool:
         return True
@@ -92,37 +218,13 @@ def test_hook_spec_validate_invalid_input_types():
     assert hook_spec.validate(hook) is False
 
 
-def test_hook_spec_validate_without_annotation():
-    """Test `HookSpec` validation with missing type annotations."""
-
-    def invalid_hook(arg1, arg2):
-        return True
-
-    hook_spec = HookSpec(name="test_spec", arg_types={"arg1": str, "arg2": int}, return_type=bool)
-    hook = Hook(name="invalid_hook", func=invalid_hook)
-    assert hook_spec.validate(hook) is False
-
-
-def test_hook_spec_validate_extra_parameter():
-    """Test `HookSpec` validation with extra parameter."""
-
-    def invalid_hook(arg1: str, arg2: int, extra: float) -> bool:
-        return True
-
+def test_hook_spec_validate_after_arg_types_reassignment():
+    """Test that `HookSpec` validation follows a reassignment of the expected argument types."""
     hook_spec = HookSpec(name="test_spec", arg_types={"arg1": str, "arg2": int}, return_type=bool)
-    hook = Hook(name="invalid_hook", func=invalid_hook)
-    assert hook_spec.validate(hook) is False
-
-
-def test_hook_spec_validate_missing_parameter():
-    """Test `HookSpec` validation with missing parameter."""
-
-    def invalid_hook(arg1: str) -> bool:
-        return True
-
-    hook_spec = HookSpec(name="test_spec", arg_types={"arg1": str, "arg2": int}, return_type=bool)
-    hook = Hook(name="invalid_hook", func=invalid_hook)
+    hook = Hook(name="test_hook", func=missing_parameter_hook)
     assert hook_spec.validate(hook) is False
+    hook_spec.arg_types = OrderedDict(arg1=str)
+    assert hook_spec.validate(hook) is True
 
 
 # --- Tests for Output Type ------------------------------------------------------------------------
@@ -139,17 +241,6 @@ def test_hook_spec_validate_no_return():
     assert hook_spec.validate(hook) is True
 
 
-def test_hook_spec_validate_invalid_output_type():
-    """Test `HookSpec` validation with invalid output type."""
-
-    def invalid_hook(arg1: str, arg2: int) -> str:
-        return "True"
-
-    hook_spec = HookSpec(name="test_spec", arg_types={"arg1": str, "arg2": int}, return_type=bool)
-    hook = Hook(name="invalid_hook", func=invalid_hook)
-    assert hook_spec.validate(hook) is False
-
-
 def test_hook_spec_validate_optional_annotation() -> None:
     """Optional annotations should validate against their expected runtime type."""
 
@@ -165,6 +256,17 @@ def test_hook_spec_validate_optional_annotation() -> None:
     assert hook_spec.validate(hook) is True
 
 
+def test_hook_spec_validate_no_arguments() -> None:
+    """Hooks without arguments should validate against a spec without expected arguments."""
+
+    def valid_hook() -> bool:
+        return True
+
+    hook_spec = HookSpec(name="test_spec", arg_types={}, return_type=bool)
+    hook = Hook(name="valid_hook", func=valid_hook)
+    assert hook_spec.validate(hook) is True
+
+
 def test_hook_spec_validate_keyword_only_parameter_rejected() -> None:
     """Unexpected keyword-only parameters should fail validation."""
 
@@ -0,0 +1,35 @@
+"""
+test_khimera.test_core.conftest
+===============================
+
+Shared fixtures for the tests of the core classes.
+
+See Also
+--------
+test_khimera.test_core.mocks
+    Mock classes used by the fixtures and the tests.
+"""
+
+# --- Silenced Errors ---
+# pylint: disable=redefined-outer-name
+#   Pytest fixtures require redefinition of variables.
+
+import pytest
+
+from .mocks import MockComponent, MockFieldSpec
+
+# --- Fixtures -------------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def mock_field_spec():
+    """Field specification with default flags, shared by the tests of a module which only read or
+    validate with it (not to be modified by the tests)."""
+    return MockFieldSpec(name="test_spec")
+
+
+@pytest.fixture(scope="session")
+def valid_component():
+    """Component with a non-empty name, valid against `MockFieldSpec` (stateless, not to be
+    modified by the tests)."""
+    return MockComponent(name="valid_comp")
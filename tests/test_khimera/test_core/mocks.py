@@ -0,0 +1,40 @@
+"""
+test_khimera.test_core.mocks
+============================
+
+Shared mock classes for the tests of the core classes.
+
+Notes
+-----
+Mock classes are defined once here and imported by the test modules (`from .mocks import ...`),
+rather than being redefined in each module. Fixtures are defined separately in the `conftest`
+module.
+"""
+
+from khimera.core.components import Component
+from khimera.core.specifications import FieldSpec
+
+# --- Mock Classes ---------------------------------------------------------------------------------
+
+
+class MockComponent(Component):
+    """Mock subclass of `Component` for testing."""
+
+
+class MockFieldSpec(FieldSpec[MockComponent]):
+    """Mock subclass of `FieldSpec` for testing."""
+
+    COMPONENT_TYPE = MockComponent
+
+    def validate(self, obj: MockComponent) -> bool:
+        """Simple validation: return True if name is non-empty."""
+        return bool(obj.name)
+
+
+class MockPlugin:
+    """Mock class representing a plugin instance, here as a collection of components."""
+
+    __slots__ = ("components",)
+
+    def __init__(self, components):
+        self.components = components
@@ -12,27 +12,13 @@ khimera.core.components
 # pylint: disable=unused-variable
 #   Test functions are used, but pylint does not detect it.
 
-import pytest
-
-from khimera.core.components import Component, ComponentSet
-from khimera.core.specifications import FieldSpec
-
-
-# --- Mock Classes ---------------------------------------------------------------------------------
-
-
-class MockComponent(Component):
-    """Mock subclass of `Component` for testing."""
+import copy
 
+import pytest
 
-class MockFieldSpec(FieldSpec[MockComponent]):
-    """Mock subclass of `FieldSpec` for testing."""
-
-    COMPONENT_TYPE = MockComponent
+from khimera.core.components import ComponentSet
 
-    def validate(self, obj: MockComponent) -> bool:
-        """Simple validation: return True if name is non-empty."""
-        return bool(obj.name)
+from .mocks import MockComponent, MockFieldSpec
 
 
 # --- Tests for Component --------------------------------------------------------------------------
@@ -106,3 +92,14 @@ def test_component_set_append_invalid():
     component_set = ComponentSet()
     with pytest.raises(TypeError):
         component_set.append(None)
+
+
+def test_component_set_slots():
+    """Test that `ComponentSet` has no instance dictionary and keeps its type when copied."""
+    component_set = ComponentSet([MockComponent(name="comp1")])
+    assert not hasattr(component_set, "__dict__")
+    clone = copy.deepcopy(component_set)
+    assert type(clone) is ComponentSet
+    assert [comp.name for comp in clone] == ["comp1"]
+    with pytest.raises(TypeError):
+        clone.append(None)
@@ -19,19 +19,10 @@ import pytest
 from khimera.core.components import Component
 from khimera.core.dependencies import DependencySpec, PredicateDependency
 
+from .mocks import MockComponent, MockPlugin
 
-# --- Mock Classes ---------------------------------------------------------------------------------
-
-
-class MockComponent(Component):
-    """Mock subclass of `Component` for testing."""
 
-
-class MockPlugin:
-    """Mock class representing a plugin instance, here as a collection of components."""
-
-    def __init__(self, components):
-        self.components = components
+# --- Mock Classes ---------------------------------------------------------------------------------
 
 
 class MockDependencySpec(DependencySpec):
@@ -39,7 +30,7 @@ class MockDependencySpec(DependencySpec):
 
     def validate(self, obj: MockPlugin) -> bool:
         """Simple validation: return True if plugin has all required dependencies."""
-        return all(dep in obj.components for dep in self.fields)
+        return obj.components.keys() >= self._field_set
 
 
 # ---- Tests for DependencySpec --------------------------------------------------------------------
@@ -64,7 +55,7 @@ def mock_predicate(dep1: Component, dep2: Component) -> bool:
     return dep1.name == "dep1" and dep2.name == "dep2"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dependency_spec():
     """Fixture for a `PredicateDependency` instance containing two dependencies and a predicate."""
     return PredicateDependency(
@@ -72,23 +63,56 @@ def dependency_spec():
     )
 
 
-def test_predicate_dependency_validate_correct(dependency_spec: PredicateDependency):
-    """Test `PredicateDependency` validation with correct dependencies."""
-    plugin = MockPlugin(
-        components={"dep1": MockComponent(name="dep1"), "dep2": MockComponent(name="dep2")}
+@pytest.fixture(scope="module")
+def plugins():
+    """Plugins built once for the validation tests of the module, by test case (not to be modified
+    by the tests)."""
+    return {
+        "correct": MockPlugin(
+            components={"dep1": MockComponent(name="dep1"), "dep2": MockComponent(name="dep2")}
+        ),
+        "incorrect": MockPlugin(
+            components={
+                "dep1": MockComponent(name="dep1"),
+                "dep2": MockComponent(name="wrong_name"),
+            }
+        ),
+        "extra": MockPlugin(
+            components={
+                "dep1": MockComponent(name="dep1"),
+                "dep2": MockComponent(name="dep2"),
+                "other": MockComponent(name="other"),
+            }
+        ),
+        "missing": MockPlugin(components={"dep1": MockComponent(name="dep1")}),
+    }
+
+
+@pytest.mark.parametrize(
+    "case, expected",
+    [("correct", True), ("incorrect", False), ("extra", True), ("missing", False)],
+)
+def test_predicate_dependency_validate(
+    dependency_spec: PredicateDependency, plugins: dict, case: str, expected: bool
+):
+    """
+    Test `PredicateDependency` validation.
+
+    Test cases:
+
+    1. Correct dependencies.
+    2. Incorrect dependencies (predicate not satisfied).
+    3. Correct dependencies, along with a field not involved in the dependency.
+    4. Missing dependency.
+    """
+    assert dependency_spec.validate(plugins[case]) is expected
+
+
+def test_predicate_dependency_validate_after_fields_reassignment(plugins: dict):
+    """Test that `PredicateDependency` validation follows a reassignment of its fields."""
+    spec = PredicateDependency(
+        name="predicate_dependency", predicate=lambda **components: True, fields=["dep1"]
     )
-    assert dependency_spec.validate(plugin) is True
-
-
-def test_predicate_dependency_validate_incorrect(dependency_spec: PredicateDependency):
-    """Test `PredicateDependency` validation with incorrect dependencies."""
-    plugin = MockPlugin(
-        components={"dep1": MockComponent(name="dep1"), "dep2": MockComponent(name="wrong_name")}
-    )
-    assert dependency_spec.validate(plugin) is False
-
-
-def test_predicate_dependency_validate_missing_dependency(dependency_spec: PredicateDependency):
-    """Test `PredicateDependency` validation with missing dependencies."""
-    plugin = MockPlugin(components={"dep1": MockComponent(name="dep1")})
-    assert dependency_spec.validate(plugin) is False
+    assert spec.validate(plugins["missing"]) is True
+    spec.fields = ("dep1", "dep2")
+    assert spec.validate(plugins["missing"]) is False
@@ -11,28 +11,10 @@ khimera.core.specifications
 # --- Silenced Errors ---
 # pylint: disable=unused-variable
 #   Test functions are used, but pylint does not detect it.
+# pylint: disable=redefined-outer-name
+#   Pytest fixtures require redefinition of variables.
 
-import pytest
-
-from khimera.core.components import Component
-from khimera.core.specifications import FieldSpec
-
-
-# --- Mock Classes ---------------------------------------------------------------------------------
-
-
-class MockComponent(Component):
-    """Mock subclass of `Component` for testing."""
-
-
-class MockFieldSpec(FieldSpec[MockComponent]):
-    """Mock subclass of `FieldSpec` for testing."""
-
-    COMPONENT_TYPE = MockComponent
-
-    def validate(self, obj: MockComponent) -> bool:
-        """Simple validation: return True if name is non-empty."""
-        return bool(obj.name)
+from .mocks import MockComponent, MockFieldSpec
 
 
 # ---- Tests for Spec (Abstract Base Class) --------------------------------------------------------
@@ -72,27 +54,23 @@ def test_spec_equality():
 # --- Tests for FieldSpec -----------------------------------------------------------------------
 
 
-def test_spec_category():
+def test_spec_category(mock_field_spec):
     """Test getting the category of a `FieldSpec` object."""
-    field = MockFieldSpec(name="test_spec")
-    assert field.category == MockComponent
+    assert mock_field_spec.category == MockComponent
 
 
-@pytest.mark.parametrize(
-    "required, unique", [(True, False), (False, True), (True, True), (False, False)]
-)
-def test_category_spec_initialization(required, unique):
+def test_category_spec_initialization():
     """Test initializing a `FieldSpec` object with required and unique flags."""
     name = "test_spec"
-    field = MockFieldSpec(name=name, required=required, unique=unique)
-    assert field.name == name
-    assert field.required == required
-    assert field.unique == unique
+    for required, unique in [(True, False), (False, True), (True, True), (False, False)]:
+        field = MockFieldSpec(name=name, required=required, unique=unique)
+        case = f"required={required}, unique={unique}"
+        assert field.name == name, case
+        assert field.required == required, case
+        assert field.unique == unique, case
 
 
-@pytest.mark.parametrize("comp_name, expected", [("valid_comp", True), ("", False)])
-def test_category_spec_validation(comp_name, expected):
+def test_category_spec_validation(mock_field_spec, valid_component):
     """Test validating a `FieldSpec` object against a component."""
-    field = MockFieldSpec(name="test_spec")
-    comp = MockComponent(name=comp_name)
-    assert field.validate(comp) == expected
+    assert mock_field_spec.validate(valid_component) is True
+    assert mock_field_spec.validate(MockComponent(name="")) is False
@@ -0,0 +1,86 @@
+"""
+test_khimera.test_discovery.conftest
+====================================
+
+Shared fixtures for the tests of the discovery strategies.
+
+Notes
+-----
+The metadata of the installed packages is never read by the tests: `importlib.metadata.entry_points`
+is patched once per test, and the entry points it returns are controlled through the
+`entry_points_ctl` fixture rather than by patching the function again.
+"""
+
+# --- Silenced Errors ---
+# pylint: disable=redefined-outer-name
+#   Pytest fixtures require redefinition of variables.
+
+import importlib.metadata
+from typing import Iterable, Union
+from unittest.mock import Mock
+
+import pytest
+import pytest_mock
+
+from khimera.discovery.strategies import clear_entry_points_cache
+
+# --- Fixtures and Utilities -----------------------------------------------------------------------
+
+
+class EntryPointsController:
+    """
+    Controls the result of the patched `importlib.metadata.entry_points` function.
+
+    Attributes
+    ----------
+    patched : Mock
+        Patched function, to inspect its calls.
+    """
+
+    def __init__(self, patched: Mock):
+        self.patched = patched
+
+    def set(self, value: Union[Iterable, Exception]) -> None:
+        """
+        Set the entry points returned by the next retrievals, or the error they raise.
+
+        Arguments
+        ---------
+        value : Iterable or Exception
+            Entry points to return, or exception to raise.
+
+        Notes
+        -----
+        The cache of the retrieved entry points is cleared, so that the patched function is called
+        at the next retrieval.
+        """
+        clear_entry_points_cache()
+        if isinstance(value, Exception):
+            self.patched.side_effect = value
+        else:
+            self.patched.side_effect = None
+            self.patched.return_value = value
+
+
+@pytest.fixture(autouse=True)
+def entry_points_ctl(mocker: pytest_mock.MockFixture):
+    """
+    Patch `importlib.metadata.entry_points` (no entry points by default) for each test.
+
+    Returns
+    -------
+    EntryPointsController
+        Controller of the entry points returned by the patched function.
+
+    Notes
+    -----
+    The function is patched for each test rather than once for the module, so that the calls
+    recorded and the results set by a test do not leak into the next ones. The cache of the
+    retrieved entry points is cleared around each test, to isolate the tests from each other and
+    from the actual installed packages.
+    """
+    clear_entry_points_cache()
+    yield EntryPointsController(
+        mocker.patch.object(importlib.metadata, "entry_points", return_value=[])
+    )
+    clear_entry_points_cache()
@@ -11,7 +11,9 @@ Mocking Strategy:
 
 - Plugin Instances: Mocked to isolate discovery logic from plugin creation logic. Mocked
   attributes: `name`, `version`, `model` (used in filtering).
-- PluginModel: Mocked to avoid dependencies on validation logic.
+- PluginModel: Not mocked, since the finder only compares models with each other. Empty models
+  with distinct names are cheaper to build than mocks specified from the class, and distinct by
+  deep comparison.
 
 Warning
 -------
@@ -23,53 +25,23 @@ See Also
 --------
 khimera.discovery.find
     Module under test.
-pytest_mock.MockFixture
-    Mocking fixture for Pytest.
+conftest.make_plugin
+    Factory of mocked plugins, shared by the discovery tests.
 """
-from typing import Optional
+from types import SimpleNamespace
+from typing import List, Optional
 
 import pytest
-import pytest_mock
 
 from khimera.discovery.find import PluginFinder
 from khimera.plugins.create import Plugin
 from khimera.plugins.declare import PluginModel
-from khimera.utils.factories import TypeConstrainedList
 from khimera.exceptions import PluginNotFoundError, AmbiguousLookupError
 
 
 # --- Fixtures and Utilities -----------------------------------------------------------------------
 
 
-def mock_plugin(
-    mocker: pytest_mock.MockFixture,
-    name: str,
-    version: str = "1.0.0",
-    model: Optional[PluginModel] = None,
-):
-    """
-    Create a mock `Plugin` instance with a specified name, version, and optional model.
-
-    Arguments
-    ---------
-    name : str
-        Name of the plugin.
-    version : str, default="1.0.0"
-        Version of the plugin.
-    model : PluginModel, optional
-        Plugin model associated with the plugin.
-
-    Returns
-    -------
-    Plugin
-        Mocked plugin instance.
-    """
-    plugin = mocker.Mock(spec=Plugin)
-    plugin.name = name
-    plugin.version = version
-    plugin.model = model
-    return plugin
-
 
 class ConcreteFinder(PluginFinder):
     """Minimal concrete implementation of PluginFinder for testing."""
@@ -79,6 +51,53 @@ class ConcreteFinder(PluginFinder):
         pass
 
 
+@pytest.fixture(scope="module")
+def shared_finder():
+    """Finder instance created once for the module, and emptied after each test using it (see
+    `finder`)."""
+    return ConcreteFinder()
+
+
+@pytest.fixture
+def finder(shared_finder):
+    """Empty finder for a test storing plugins, emptied on teardown for the next test."""
+    yield shared_finder
+    shared_finder.clear()
+
+
+@pytest.fixture(scope="module")
+def populated_finder(make_plugin):
+    """
+    Finder storing three plugins, built once for the lookup tests of the module (not to be modified
+    by the tests).
+
+    Returns
+    -------
+    SimpleNamespace
+        `finder` (finder instance), `plugins` (stored plugins by key) and `models` (plugin models by
+        key).
+
+    Notes
+    -----
+    Plugins, in storage order:
+
+    - "plugin1": name "pluginA", version "1.0.0", model "modelA"
+    - "plugin2": name "pluginA", version "1.1.0", model "modelA"
+    - "plugin3": name "pluginB", version "2.0.0", model "modelB"
+
+    The model "unused" is not associated with any plugin.
+    """
+    models = {key: PluginModel(name=key) for key in ("modelA", "modelB", "unused")}
+    plugins = {
+        "plugin1": make_plugin("pluginA", "1.0.0", model=models["modelA"]),
+        "plugin2": make_plugin("pluginA", "1.1.0", model=models["modelA"]),
+        "plugin3": make_plugin("pluginB", "2.0.0", model=models["modelB"]),
+    }
+    finder = ConcreteFinder()
+    finder.store_many(plugins.values())
+    return SimpleNamespace(finder=finder, plugins=plugins, models=models)
+
+
 # --- Tests for `PluginFinder` ---------------------------------------------------------------------
 
 
@@ -88,14 +107,14 @@ def test_plugin_finder_init():
 
     Test Case:
 
-    - `plugins` attribute: should be an empty of `TypeConstrainedList(Plugin)`.
+    - `plugins` attribute: should be an empty read-only tuple.
     """
     finder = ConcreteFinder()
-    assert isinstance(finder.plugins, TypeConstrainedList)
+    assert isinstance(finder.plugins, tuple)
     assert len(finder.plugins) == 0  # starts empty
 
 
-def test_plugin_finder_store(mocker: pytest_mock.MockerFixture):
+def test_plugin_finder_store(finder, make_plugin):
     """
     Test the `store` method of `PluginFinder`.
 
@@ -104,8 +123,7 @@ def test_plugin_finder_store(mocker: pytest_mock.MockerFixture):
     - A valid Plugin instance should be stored in the `plugins` list.
     - An invalid type should not be accepted.
     """
-    finder = ConcreteFinder()
-    plugin = mock_plugin(mocker, "test_plugin")
+    plugin = make_plugin("test_plugin")
     # Store the plugin
     finder.store(plugin)
     # Ensure the plugin is in the list
@@ -116,71 +134,184 @@ def test_plugin_finder_store(mocker: pytest_mock.MockerFixture):
         finder.store("invalid_plugin")  # Not a Plugin instance
 
 
-def test_plugin_finder_filter(mocker: pytest_mock.MockerFixture):
+@pytest.mark.parametrize(
+    "model, expected",
+    [
+        (None, ["plugin1", "plugin2", "plugin3"]),
+        ("modelA", ["plugin1", "plugin2"]),
+        ("modelB", ["plugin3"]),
+        ("unused", []),
+    ],
+)
+def test_plugin_finder_filter(populated_finder, model: Optional[str], expected: List[str]):
     """
     Test the `filter` method of `PluginFinder`.
 
     Test Cases:
 
-    - If no model is provided, all plugins should be returned.
-    - If a model is provided, only plugins matching the model should be returned.
-    - If no plugins match the model, an empty list should be returned.
+    1. If no model is provided, all plugins should be returned.
+    2. If a model is provided, only plugins matching the model should be returned (two cases).
+    3. If no plugins match the model, an empty list should be returned.
     """
-    finder = ConcreteFinder()
-    # Create mock plugin models
-    modelA = mocker.Mock(spec=PluginModel)
-    modelB = mocker.Mock(spec=PluginModel)
-    # Create plugins with different models
-    plugin1 = mock_plugin(mocker, "plugin1", model=modelA)
-    plugin2 = mock_plugin(mocker, "plugin2", model=modelA)
-    plugin3 = mock_plugin(mocker, "plugin3", model=modelB)
-    # Store plugins
+    model_instance = populated_finder.models[model] if model else None
+    expected_plugins = [populated_finder.plugins[key] for key in expected]
+    assert populated_finder.finder.filter(model_instance) == expected_plugins
+
+
+def test_plugin_finder_store_many(finder, make_plugin):
+    """
+    Test the `store_many` method of `PluginFinder`.
+
+    Test Case:
+
+    - Valid plugins should be stored in order and retrievable by name.
+    - If any item is invalid, none of the items should be stored.
+    """
+    plugin1 = make_plugin("pluginA")
+    plugin2 = make_plugin("pluginB")
+    finder.store_many(iter([plugin1, plugin2]))  # any iterable
+    assert list(finder) == [plugin1, plugin2]
+    assert finder.get("pluginB") == [plugin2]
+    with pytest.raises(TypeError):
+        finder.store_many([make_plugin("pluginC"), "invalid_plugin"])
+    assert list(finder) == [plugin1, plugin2]
+    assert finder.get("pluginC") == []
+
+
+def test_plugin_finder_filter_equal_models(finder):
+    """
+    Test that `filter` matches plugins whose models are distinct but equal objects.
+
+    Test Case:
+
+    - Plugins adhering to two equal copies of a model, interleaved with a plugin of another model,
+      are all returned in storage order.
+    """
+    model1 = PluginModel(name="modelA")
+    model2 = model1.copy()
+    other = PluginModel(name="modelB")
+    plugins = [Plugin(name=f"plugin{i}", model=m) for i, m in enumerate([model1, other, model2])]
+    for plugin in plugins:
+        finder.store(plugin)
+    assert finder.filter(model1) == [plugins[0], plugins[2]]
+    assert finder.filter(other) == [plugins[1]]
+
+
+def test_plugin_finder_clear(finder, make_plugin):
+    """
+    Test the `clear` method of `PluginFinder`.
+
+    Test Case:
+
+    - All the plugins are removed, and are no longer found by name nor by model.
+    - Plugins stored afterwards are found again.
+    """
+    model = PluginModel(name="modelA")
+    plugin = make_plugin("pluginA", model=model)
+    finder.store(plugin)
+    finder.clear()
+    assert not list(finder)
+    assert finder.get("pluginA") == []
+    assert finder.filter(model) == []
+    finder.store(plugin)
+    assert finder.get("pluginA") == [plugin]
+    assert finder.filter(model) == [plugin]
+
+
+@pytest.mark.parametrize(
+    "name, version, expected",
+    [
+        ("pluginB", None, ["plugin3"]),
+        ("pluginA", None, ["plugin1", "plugin2"]),
+        ("pluginA", "1.0.0", ["plugin1"]),
+        ("pluginA", "1.1.0", ["plugin2"]),
+        ("pluginX", None, []),
+    ],
+)
+def test_plugin_finder_get(
+    populated_finder, name: str, version: Optional[str], expected: List[str]
+):
+    """
+    Test the `get` method of `PluginFinder`.
+
+    Test Cases:
+
+    1. Retrieve a plugin by name when only one exists with that name -> list with one element.
+    2. Retrieve multiple plugins when multiple versions exist -> list with multiple elements.
+    3. Retrieve a specific version of a plugin -> list with one element (two cases).
+    4. Return empty list when no plugin matches the given name.
+    """
+    expected_plugins = [populated_finder.plugins[key] for key in expected]
+    assert populated_finder.finder.get(name, version) == expected_plugins
+
+
+def test_plugin_finder_get_duplicates(finder, make_plugin):
+    """
+    Test that `get` returns all the plugins stored under the same name and version.
+
+    Test Cases:
+
+    - Plugins with identical names and versions are all kept, in storage order.
+    - Mutating the returned list does not affect the finder.
+    """
+    plugin1 = make_plugin("pluginA", "1.0.0")
+    plugin2 = make_plugin("pluginA", "1.0.0")
     finder.store(plugin1)
     finder.store(plugin2)
+    assert finder.get("pluginA", "1.0.0") == [plugin1, plugin2]
+    finder.get("pluginA").clear()
+    assert finder.get("pluginA") == [plugin1, plugin2]
+
+
+def test_plugin_finder_assign_plugins(finder, make_plugin):
+    """
+    Test assigning a new list of plugins to a `PluginFinder`.
+
+    Test Cases:
+
+    - The assigned plugins are type checked, and found by name and by model.
+    - The formerly stored plugins are no longer found.
+    - Plugins stored afterwards are found along with the assigned ones.
+    """
+    model = PluginModel(name="modelA")
+    plugin1 = make_plugin("pluginA", model=model)
+    plugin2 = make_plugin("pluginB", model=model)
+    plugin3 = make_plugin("pluginC")
+    finder.store(plugin1)
+    finder.plugins = [plugin2]
+    assert finder.plugins == (plugin2,)
+    assert finder.get("pluginA") == []
+    assert finder.get("pluginB") == [plugin2]
+    assert finder.filter(model) == [plugin2]
     finder.store(plugin3)
-    # Case 1: No model provided -> Expect all plugins
-    assert finder.filter(None) == [plugin1, plugin2, plugin3]
-    # Case 2: Filter by modelA -> Expect only plugin1 and plugin2
-    assert finder.filter(modelA) == [plugin1, plugin2]
-    # Case 3: Filter by modelB -> Expect only plugin3
-    assert finder.filter(modelB) == [plugin3]
-    # Case 4: Filter by an unused model -> Expect an empty list
-    unused_model = mocker.Mock(spec=PluginModel)
-    assert finder.filter(unused_model) == []
+    assert list(finder) == [plugin2, plugin3]
+    assert finder.get("pluginC") == [plugin3]
+    with pytest.raises(TypeError):
+        finder.plugins = ["invalid_plugin"]  # not a Plugin instance
 
 
-def test_plugin_finder_get(mocker: pytest_mock.MockerFixture):
+def test_plugin_finder_plugins_read_only(finder, make_plugin):
     """
-    Test the `get` method of `PluginFinder`.
+    Test that the `plugins` attribute of `PluginFinder` cannot be modified in place.
 
     Test Cases:
 
-    - Retrieve a plugin by name when only one exists with that name -> list with one element.
-    - Retrieve multiple plugins when multiple versions exist -> list with multiple elements.
-    - Retrieve a specific version of a plugin -> list with one element.
-    - Return empty list when no plugin matches the given name.
+    - The tuple of plugins has no mutating method, so that the indices cannot become stale.
+    - The tuple follows the plugins stored and cleared afterwards.
     """
-    finder = ConcreteFinder()
-    # Create plugins with different names and versions
-    plugin1 = mock_plugin(mocker, "pluginA", "1.0.0")
-    plugin2 = mock_plugin(mocker, "pluginA", "1.1.0")
-    plugin3 = mock_plugin(mocker, "pluginB", "2.0.0")
-    # Store plugins
+    plugin1 = make_plugin("pluginA")
+    plugin2 = make_plugin("pluginB")
     finder.store(plugin1)
+    with pytest.raises(AttributeError):
+        finder.plugins.append(plugin2)  # type: ignore[attr-defined]
     finder.store(plugin2)
-    finder.store(plugin3)
-    # Case 1: Retrieve a single plugin by name -> list with one element
-    assert finder.get("pluginB", None) == [plugin3]
-    # Case 2: Retrieve multiple plugins with the same name but different versions
-    assert finder.get("pluginA", None) == [plugin1, plugin2]
-    # Case 3: Retrieve a specific version -> list with one element
-    assert finder.get("pluginA", "1.0.0") == [plugin1]
-    assert finder.get("pluginA", "1.1.0") == [plugin2]
-    # Case 4: Retrieve a plugin that does not exist -> empty list
-    assert finder.get("pluginX", None) == []
+    assert finder.plugins == (plugin1, plugin2)
+    assert finder.get("pluginB") == [plugin2]
+    finder.clear()
+    assert finder.plugins == ()
 
 
-def test_plugin_finder_get_one(mocker: pytest_mock.MockerFixture):
+def test_plugin_finder_get_one(populated_finder):
     """
     Test the `get_one` method of `PluginFinder`.
 
@@ -190,16 +321,10 @@ def test_plugin_finder_get_one(mocker: pytest_mock.MockerFixture):
     - Raise PluginNotFoundError when no plugin matches.
     - Raise AmbiguousLookupError when multiple plugins match.
     """
-    finder = ConcreteFinder()
-    plugin1 = mock_plugin(mocker, "pluginA", "1.0.0")
-    plugin2 = mock_plugin(mocker, "pluginA", "1.1.0")
-    plugin3 = mock_plugin(mocker, "pluginB", "2.0.0")
-    finder.store(plugin1)
-    finder.store(plugin2)
-    finder.store(plugin3)
+    finder, plugins = populated_finder.finder, populated_finder.plugins
     # Case 1: Exactly one match
-    assert finder.get_one("pluginB") is plugin3
-    assert finder.get_one("pluginA", "1.0.0") is plugin1
+    assert finder.get_one("pluginB") is plugins["plugin3"]
+    assert finder.get_one("pluginA", "1.0.0") is plugins["plugin1"]
     # Case 2: No match -> PluginNotFoundError
     with pytest.raises(PluginNotFoundError):
         finder.get_one("pluginX")
@@ -208,7 +333,7 @@ def test_plugin_finder_get_one(mocker: pytest_mock.MockerFixture):
         finder.get_one("pluginA")
 
 
-def test_plugin_finder_iter(mocker: pytest_mock.MockerFixture):
+def test_plugin_finder_iter(populated_finder):
     """
     Test that PluginFinder is iterable.
 
@@ -216,11 +341,5 @@ def test_plugin_finder_iter(mocker: pytest_mock.MockerFixture):
 
     - Ensure that iterating over a PluginFinder instance yields its stored plugins in order.
     """
-    finder = ConcreteFinder()
-    # Create and store plugins
-    plugin1 = mock_plugin(mocker, "pluginA", "1.0.0")
-    plugin2 = mock_plugin(mocker, "pluginB", "2.0.0")
-    finder.store(plugin1)
-    finder.store(plugin2)
-    # Convert iterator to a list and compare with expected order
-    assert list(iter(finder)) == [plugin1, plugin2]
+    expected = list(populated_finder.plugins.values())  # storage order
+    assert list(iter(populated_finder.finder)) == expected
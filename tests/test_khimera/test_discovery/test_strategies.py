@@ -14,9 +14,10 @@ Mocking Strategy:
 - PluginModel: Mocked to avoid dependencies on validation logic.
 - Entry Points: Mocked to control the discovery process and avoid dependencies on external
   package metadata.
-- Metadata Retrieval (`importlib.metadata.entry_points`): Mocked to simulate installed plugins
-  with declared entry points.
-- Entry Point Loading (`entry_point.load`): Mocked to return controlled plugin instances.
+- Metadata Retrieval (`importlib.metadata.entry_points`): Patched for each test to simulate
+  installed plugins with declared entry points, controlled with the `entry_points_ctl` fixture.
+- Entry Point Loading (`entry_point.load`): Simulated by `FakeEntryPoint` instances returning
+  controlled plugin instances (lighter than mocks, since only `load` is called).
 
 Warning
 -------
@@ -30,66 +31,33 @@ khimera.discovery.strategies
     Module under test.
 pytest_mock.MockFixture
     Mocking fixture for Pytest.
+conftest.make_plugin
+    Factory of mocked plugins, shared by the discovery tests.
+test_khimera.test_discovery.conftest.entry_points_ctl
+    Controller of the patched entry points.
 """
-import importlib.metadata
-from typing import List, Optional
+from dataclasses import dataclass
 
 import pytest
 import pytest_mock
 
-from khimera.discovery.strategies import FromInstalledFinder
-from khimera.plugins.create import Plugin
-from khimera.plugins.declare import PluginModel
+from khimera.discovery.strategies import FromInstalledFinder, clear_entry_points_cache
 from khimera.exceptions import KhimeraError
 
 
 # --- Fixtures and Utilities -----------------------------------------------------------------------
 
 
-def mock_plugin(
-    mocker: pytest_mock.MockFixture,
-    name: str,
-    version: str = "1.0.0",
-    model: Optional[PluginModel] = None,
-):
-    """
-    Create a mock `Plugin` instance with a specified name, version, and optional model.
-
-    Arguments
-    ---------
-    name : str
-        Name of the plugin.
-    version : str, default="1.0.0"
-        Version of the plugin.
-    model : PluginModel, optional
-        Plugin model associated with the plugin.
-
-    Returns
-    -------
-    Plugin
-        Mocked plugin instance.
-    """
-    plugin = mocker.Mock(spec=Plugin)
-    plugin.name = name
-    plugin.version = version
-    plugin.model = model
-    return plugin
+@dataclass(slots=True)
+class FakeEntryPoint:
+    """Minimal stand-in for `importlib.metadata.EntryPoint`, loading a predefined object."""
 
+    payload: object
+    name: str = "fake_entry_point"  # reported in discovery errors
 
-def patch_entry_points(mocker: pytest_mock.MockFixture, entry_points: List):
-    """
-    Patch `importlib.metadata.entry_points` to return a controlled set of entry points.
-
-    Arguments
-    ---------
-    entry_points : list
-        Mocked entry points to return.
-
-    Returns
-    -------
-    None
-    """
-    mocker.patch.object(importlib.metadata, "entry_points", return_value=entry_points)
+    def load(self):
+        """Return the predefined object, as if it were imported from the entry point."""
+        return self.payload
 
 
 # --- Tests for `FromInstalledFinder` -------------------------------------------------------
@@ -118,7 +86,7 @@ def test_entry_points_finder_init():
     assert len(finder2.plugins) == 0
 
 
-def test_entry_points_finder_get_entry_points(mocker: pytest_mock.MockFixture):
+def test_entry_points_finder_get_entry_points(mocker: pytest_mock.MockFixture, entry_points_ctl):
     """
     Test the `get_entry_points` method of `FromInstalledFinder`.
 
@@ -131,18 +99,50 @@ def test_entry_points_finder_get_entry_points(mocker: pytest_mock.MockFixture):
     finder = FromInstalledFinder(app_name="test_app")
     mock_entry_point = mocker.Mock()  # entry point returned by `importlib.metadata.entry_points`
     # Case 1: Entry points exist
-    patch_entry_points(mocker, [mock_entry_point])
+    entry_points_ctl.set([mock_entry_point])
     assert finder.get_entry_points() == [mock_entry_point]
+    entry_points_ctl.patched.assert_called_once_with(group="test_app.plugins")
     # Case 2: No entry points exist
-    patch_entry_points(mocker, [])
+    entry_points_ctl.set([])
     assert finder.get_entry_points() == []
     # Case 3: `importlib.metadata.entry_points` raises an error
-    mocker.patch.object(importlib.metadata, "entry_points", side_effect=Exception("Metadata error"))
+    entry_points_ctl.set(Exception("Metadata error"))
     with pytest.raises(RuntimeError, match="Failed to retrieve entry points"):
         finder.get_entry_points()
 
 
-def test_entry_points_finder_discover(mocker: pytest_mock.MockFixture):
+def test_entry_points_finder_get_entry_points_cached(
+    mocker: pytest_mock.MockFixture, entry_points_ctl
+):
+    """
+    Test that the entry points of a group are retrieved once and shared by the finders.
+
+    Test Cases:
+
+    - Repeated retrievals, from one or several finders of the same group, scan the installed
+      packages once.
+    - Another group is retrieved separately.
+    - After clearing a finder, or the cache itself, entry points are retrieved again.
+    """
+    mock_entry_point = mocker.Mock()
+    entry_points_ctl.set([mock_entry_point])
+    entry_points = entry_points_ctl.patched
+    finder1 = FromInstalledFinder(app_name="test_app")
+    finder2 = FromInstalledFinder(app_name="test_app")
+    assert finder1.get_entry_points() == [mock_entry_point]
+    assert finder2.get_entry_points() == [mock_entry_point]
+    entry_points.assert_called_once_with(group="test_app.plugins")
+    FromInstalledFinder(app_name="other_app").get_entry_points()
+    assert entry_points.call_count == 2
+    finder1.clear()
+    finder2.get_entry_points()
+    assert entry_points.call_count == 3
+    clear_entry_points_cache()
+    finder1.get_entry_points()
+    assert entry_points.call_count == 4
+
+
+def test_entry_points_finder_discover(entry_points_ctl, make_plugin):
     """
     Test the `discover` method of `FromInstalledFinder`.
 
@@ -156,24 +156,22 @@ def test_entry_points_finder_discover(mocker: pytest_mock.MockFixture):
     """
     finder = FromInstalledFinder(app_name="test_app")
     # Mock entry points
-    valid_plugin = mock_plugin(mocker, "valid_plugin")
+    valid_plugin = make_plugin("valid_plugin")
     invalid_plugin = "invalid_plugin"  # not Plugin
-    entry_point_valid = mocker.Mock()
-    entry_point_valid.load.return_value = valid_plugin
-    entry_point_invalid = mocker.Mock()
-    entry_point_invalid.load.return_value = invalid_plugin
+    entry_point_valid = FakeEntryPoint(valid_plugin)
+    entry_point_invalid = FakeEntryPoint(invalid_plugin)
     # Case 1: Discover valid plugins
-    mocker.patch.object(finder, "get_entry_points", return_value=[entry_point_valid])
+    entry_points_ctl.set([entry_point_valid])
     finder.discover()
     assert len(finder.plugins) == 1
     assert finder.plugins[0] == valid_plugin
     # Case 2: Discover invalid plugin
-    finder.plugins.clear()  # Reset state
-    mocker.patch.object(finder, "get_entry_points", return_value=[entry_point_invalid])
+    finder.clear()  # Reset state
+    entry_points_ctl.set([entry_point_invalid])
     with pytest.raises(KhimeraError, match="Invalid plugin loaded from entry point"):
         finder.discover()
     # Case 3: No entry points found
-    finder.plugins.clear()
-    mocker.patch.object(finder, "get_entry_points", return_value=[])
+    finder.clear()
+    entry_points_ctl.set([])
     finder.discover()
     assert len(finder.plugins) == 0
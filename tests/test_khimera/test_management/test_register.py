@@ -23,8 +23,8 @@ Mocking strategy:
 - Plugin: Mocked to isolate registry operations from specific plugin implementations. Mocked
   attributes: `name` and `components` (used in the test) and `model` (required by the validator).
 - PluginValidator: Mocked to avoid dependencies on validation logic and focus on registry behavior.
-  Only the `validate` method is patched to return the desired validation result, since the validator
-  is not passed by dependency injection and its method is called internally in the registry.
+  Only the `validate` method is patched, for the whole module, to return a valid result (see
+  `valid_validator`). Tests expecting an invalid plugin override this patch locally.
 
 Warning
 -------
@@ -110,30 +110,32 @@ def mock_plugin(
             for key, names in components.items()
         }
     else:
-        plugin_comps = {"key1": ComponentSet([mocker.Mock(spec=Component, name="compA")])}
+        plugin_comps = {"key1": ComponentSet([mock_component(mocker, "compA")])}
     plugin = mocker.Mock(spec=Plugin)
     plugin.configure_mock(name=name, model=mocker.Mock(spec=PluginModel), components=plugin_comps)
     return plugin
 
 
-def patch_validator(mocker: pytest_mock.MockFixture, valid: bool = True):
+@pytest.fixture(scope="module", autouse=True)
+def valid_validator():
     """
-    Patch the `validate` method of the `PluginValidator` class to return a ``ValidationResult``.
+    Patch the `validate` method of the `PluginValidator` class to return a valid
+    ``ValidationResult``, for all the tests of the module.
 
-    Arguments
-    ---------
-    valid : bool, default=True
-        Whether the returned ``ValidationResult`` should represent a valid plugin.
-
-    Returns
-    -------
-    None
+    Notes
+    -----
+    The patch is applied once for the module rather than in each test registering a plugin. Tests
+    expecting an invalid plugin override it locally with the `monkeypatch` fixture, which restores
+    this patch at teardown. A new result is returned at each call, so that tests cannot alter the
+    result of the others.
     """
-    if valid:
-        result = ValidationResult()
-    else:
-        result = ValidationResult(missing=["required_field"])
-    mocker.patch.object(PluginValidator, "validate", return_value=result)
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(
+            PluginValidator,
+            "validate",
+            lambda self, parallel=False, max_workers=None: ValidationResult(),
+        )
+        yield
 
 
 # --- Tests for ConflictResolver -------------------------------------------------------------------
@@ -445,13 +447,11 @@ def test_plugin_registry_register(mocker: pytest_mock.MockFixture):
     -----
     Mocking strategy:
 
-    - Patch the `validate` method of the `PluginValidator` to return a valid
-      ``ValidationResult`` (bypassing validation logic).
+    - The `validate` method of the `PluginValidator` returns a valid ``ValidationResult``
+      (bypassing validation logic, see `valid_validator`).
     - Spy the `unpack` and `enable` methods of the registry to ensure they are called.
     """
     registry = PluginRegistry(enable_by_default=True)
-    # Patch the validator to always return a valid result
-    patch_validator(mocker, valid=True)
     # Spy on `unpack` and `enable`
     mock_unpack = mocker.spy(registry, "unpack")
     mock_enable = mocker.spy(registry, "enable")
@@ -465,7 +465,9 @@ def test_plugin_registry_register(mocker: pytest_mock.MockFixture):
         mock_enable.assert_called_once_with(plugin.name)
 
 
-def test_plugin_registry_register_invalid_plugin(mocker):
+def test_plugin_registry_register_invalid_plugin(
+    mocker: pytest_mock.MockFixture, monkeypatch: pytest.MonkeyPatch
+):
     """
     Test attempting to register an invalid plugin.
 
@@ -477,7 +479,11 @@ def test_plugin_registry_register_invalid_plugin(mocker):
     - The `unpack` method should never be called.
     """
     registry = PluginRegistry()
-    patch_validator(mocker, valid=False)  # force invalid plugin
+    monkeypatch.setattr(  # force invalid plugin
+        PluginValidator,
+        "validate",
+        lambda self, parallel=False, max_workers=None: ValidationResult(missing=["required_field"]),
+    )
     plugin = mock_plugin(mocker)
     with pytest.raises(PluginValidationError):
         registry.register(plugin)
@@ -495,7 +501,6 @@ def test_plugin_registry_register_conflict_override(mocker):
     - The `unpack` and `enable` methods should be called for the new plugin.
     """
     registry = PluginRegistry(resolver=ConflictResolver(OverrideOnConflict()))
-    patch_validator(mocker, valid=True)  # force valid plugin
     # Create two plugin instances with the same name
     name = "test_plugin"
     plugin1 = mock_plugin(mocker, name=name)
@@ -515,7 +520,6 @@ def test_plugin_registry_register_conflict_override(mocker):
 def test_plugin_registry_register_conflict_override_replaces_components(mocker):
     """Overriding a plugin should replace its unpacked components as well."""
     registry = PluginRegistry(resolver=ConflictResolver(OverrideOnConflict()))
-    patch_validator(mocker, valid=True)
 
     first = mock_plugin(mocker, name="test_plugin", components={"key1": ["compA"]})
     second = mock_plugin(mocker, name="test_plugin", components={"key1": ["compB"]})
@@ -542,7 +546,6 @@ def test_plugin_registry_register_conflict_ignore(mocker):
     - The `unpack` method should not be called for the new plugin.
     """
     registry = PluginRegistry(resolver=ConflictResolver(IgnoreOnConflict()))
-    patch_validator(mocker, valid=True)  # force valid plugin
     # Create two plugin instances with the same name
     name = "test_plugin"
     plugin1 = mock_plugin(mocker, name=name)
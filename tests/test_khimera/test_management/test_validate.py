@@ -265,6 +265,60 @@ def test_check_rules(
         assert mock_specs[field].validate.call_count == len(comps)
 
 
+def test_check_rules_parallel(mocker: pytest_mock.MockFixture):
+    """
+    Test if `check_rules` in parallel mode runs IO-bound rules and keeps the components order.
+
+    Mocking:
+
+    - One IO-bound spec (``IO_BOUND = True``) and one CPU-bound spec, with plain validation
+      functions.
+    - Model with a `get` method that returns them.
+    - Plugin with components stored in bare lists.
+    """
+    io_spec = mocker.Mock(IO_BOUND=True, validate=mocker.Mock(side_effect=lambda x: x % 2 == 0))
+    cpu_spec = mocker.Mock(IO_BOUND=False, validate=mocker.Mock(side_effect=lambda x: x > 1))
+    mock_model = mocker.Mock(spec=PluginModel)
+    mock_model.get.side_effect = {"io": io_spec, "cpu": cpu_spec}.get
+    components = {"io": list(range(10)), "cpu": [1, 2, 3]}
+    mock_plugin = mocker.Mock(spec=Plugin, model=mock_model, components=components)
+    validator = PluginValidator(mock_plugin)
+    validator.check_rules(parallel=True, max_workers=4)
+    assert validator.invalid == {"io": [1, 3, 5, 7, 9], "cpu": [1]}
+    assert io_spec.validate.call_count == 10
+    assert cpu_spec.validate.call_count == 3
+
+
+def test_check_rules_parallel_without_io_bound(mocker: pytest_mock.MockFixture):
+    """
+    Test that `check_rules` in parallel mode does not create a thread pool if no specification is
+    IO-bound.
+    """
+    executor = mocker.patch("khimera.management.validate.ThreadPoolExecutor")
+    cpu_spec = mocker.Mock(IO_BOUND=False, validate=mocker.Mock(side_effect=lambda x: x > 1))
+    mock_model = mocker.Mock(spec=PluginModel)
+    mock_model.get.return_value = cpu_spec
+    mock_plugin = mocker.Mock(spec=Plugin, model=mock_model, components={"cpu": [1, 2, 3]})
+    validator = PluginValidator(mock_plugin)
+    validator.check_rules(parallel=True)
+    assert validator.invalid == {"cpu": [1]}
+    executor.assert_not_called()
+
+
+def test_check_rules_unknown_field(mocker: pytest_mock.MockFixture):
+    """
+    Test that `check_rules` skips the fields absent from the model (reported by `check_unknown`).
+    """
+    spec = mocker.Mock(validate=mocker.Mock(side_effect=lambda x: x > 1))
+    mock_model = mocker.Mock(spec=PluginModel)
+    mock_model.get.side_effect = {"known": spec}.get
+    components = {"known": [1, 2], "unknown": [1, 2], "empty_unknown": []}
+    mock_plugin = mocker.Mock(spec=Plugin, model=mock_model, components=components)
+    validator = PluginValidator(mock_plugin)
+    validator.check_rules()
+    assert validator.invalid == {"known": [1]}
+
+
 @pytest.mark.parametrize(
     "dependencies, validation_results, expected_unsatisfied",
     [
@@ -393,7 +447,7 @@ def test_validate(mocker: pytest_mock.MockFixture, check_results: dict, expected
     validator.check_required.assert_called_once()
     validator.check_unique.assert_called_once()
     validator.check_unknown.assert_called_once()
-    validator.check_rules.assert_called_once()
+    validator.check_rules.assert_called_once_with(parallel=False, max_workers=None)
     validator.check_dependencies.assert_called_once()
 
 
@@ -406,7 +460,9 @@ def test_validate_recomputes_diagnostics_each_run(mocker: pytest_mock.MockFixtur
     mocker.patch.object(validator, "check_required", side_effect=lambda: setattr(validator, "missing", []))
     mocker.patch.object(validator, "check_unique", side_effect=lambda: setattr(validator, "not_unique", []))
     mocker.patch.object(validator, "check_unknown", side_effect=lambda: setattr(validator, "unknown", []))
-    mocker.patch.object(validator, "check_rules", side_effect=lambda: setattr(validator, "invalid", {}))
+    mocker.patch.object(
+        validator, "check_rules", side_effect=lambda **kwargs: setattr(validator, "invalid", {})
+    )
     mocker.patch.object(
         validator,
         "check_dependencies",
@@ -12,12 +12,91 @@ khimera.utils.factories
 # pylint: disable=unused-variable
 #   Test functions are used, but pylint does not detect it.
 
+import copy
+import pickle
 from abc import ABC, abstractmethod
-from typing import Union, List, Type
+from typing import Any, Union, List, Type
 
 import pytest
 
-from khimera.utils.factories import TypeConstrainedList, TypeConstrainedDict
+from khimera.utils.factories import (
+    TypeConstrainedList,
+    TypeConstrainedDict,
+    make_validator,
+    resolve_hint,
+    hint_covers,
+    ANY_HINT,
+    CLASS_HINT,
+    UNION_HINT,
+    COMPLEX_HINT,
+)
+
+
+# --- Tests for make_validator ---------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "hint, value, expected",
+    [
+        (int, True, True),  # subclass instance
+        (int | str, "a", True),  # PEP 604 union
+        (Union[int, str], 1.0, False),
+        (Any, object(), True),
+        (list[int], [1], True),  # parametrized generic, delegated to beartype
+        (list[int], ["a"], False),
+    ],
+)
+def test_make_validator(hint, value, expected):
+    """Test validators built from plain classes, unions and complex hints."""
+    assert make_validator(hint)(value) is expected
+
+
+@pytest.mark.parametrize(
+    "hint, kind, display",
+    [
+        (Any, ANY_HINT, "Any"),
+        (int, CLASS_HINT, "int"),
+        (Union[int, float], UNION_HINT, "Union"),
+        (Union[str, List[str]], COMPLEX_HINT, "Union"),
+    ],
+)
+def test_resolve_hint(hint, kind, display):
+    """Test the analysis of type hints into kinds and displayed names."""
+    info = resolve_hint(hint)
+    assert info.kind == kind
+    assert info.display == display
+
+
+def test_make_validator_plain_class_without_beartype(mocker):
+    """Test that validators for plain classes do not depend on beartype."""
+    mocker.patch.dict("sys.modules", {"beartype": None, "beartype.door": None})
+
+    class Plain:
+        """Class never used as a hint before (no cached validator)."""
+
+    assert make_validator(Union[Plain, int])(Plain())
+
+
+@pytest.mark.parametrize(
+    "outer, inner, expected",
+    [
+        (int, bool, True),
+        (Union[int, str], Union[bool, str], True),
+        (Any, List[int], True),
+        (int, Union[int, str], False),
+        (List[int], List[int], True),
+        (List[int], List[bool], False),  # undetermined for complex hints
+    ],
+)
+def test_hint_covers(outer, inner, expected):
+    """Test the inclusion relation between type hints."""
+    assert hint_covers(outer, inner) is expected
+
+
+def test_make_validator_cached():
+    """Test that containers constrained by the same hint share the same validator."""
+    assert make_validator(Union[int, str]) is make_validator(Union[int, str])
+    assert TypeConstrainedList(int)._check is TypeConstrainedList(int)._check
 
 
 # --- Tests for TypeConstrainedList ----------------------------------------------------------------
@@ -409,6 +488,49 @@ def test_extend_invalid(value_type, initial_data, new_values):
         tc_list.extend(new_values)
 
 
+def test_extend_from_compatible_list():
+    """Test that `extend` skips checking the content of a list with the same constraint."""
+    source = TypeConstrainedList(int, [1, 2])
+    list.append(source, "unchecked")  # bypass validation to detect whether it is re-checked
+    tc_list = TypeConstrainedList(int, [0])
+    tc_list.extend(source)
+    assert tc_list.data == [0, 1, 2, "unchecked"]
+    with pytest.raises(TypeError):
+        TypeConstrainedList(str).extend(source)
+
+
+def test_extend_sampled():
+    """Test that `extend_sampled` checks at most `sample` values."""
+    tc_list = TypeConstrainedList(int)
+    tc_list.extend_sampled(range(100), sample=5)
+    assert tc_list == list(range(100))
+    with pytest.raises(TypeError):
+        tc_list.extend_sampled(["a"] * 10, sample=1)
+
+
+def test_extend_from_narrower_list():
+    """Test that `extend` skips checking the content of a list constrained to a subclass."""
+    source = TypeConstrainedList(bool, [True])
+    list.append(source, "unchecked")  # bypass validation to detect whether it is re-checked
+    tc_list = TypeConstrainedList(int)
+    tc_list.extend(source)
+    assert tc_list == [True, "unchecked"]
+
+
+def test_setitem_slice_generator():
+    """Test slice assignment in `TypeConstrainedList` with a one-shot iterator."""
+    tc_list = TypeConstrainedList(int, [1, 2, 3])
+    tc_list[0:2] = (value * 10 for value in [4, 5])
+    assert tc_list.data == [40, 50, 3]
+
+
+def test_extend_generator():
+    """Test `extend` method of `TypeConstrainedList` with a one-shot iterator."""
+    tc_list = TypeConstrainedList(int, [1])
+    tc_list.extend(value for value in (2, 3))
+    assert tc_list.data == [1, 2, 3]
+
+
 @pytest.mark.parametrize(
     "value_type, initial_data, expected",
     [
@@ -587,3 +709,174 @@ def test_update_invalid(key_type, value_type, update_data):
     tc_dict = TypeConstrainedDict(key_type, value_type, {"a": 1} if key_type == str else {1: "one"})
     with pytest.raises(TypeError):
         tc_dict.update(update_data)
+
+
+def test_update_generator():
+    """Test `update` method of `TypeConstrainedDict` with a one-shot iterator of pairs."""
+    tc_dict = TypeConstrainedDict(str, int)
+    tc_dict.update((k, v) for k, v in [("a", 1), ("b", 2)])
+    assert tc_dict.data == {"a": 1, "b": 2}
+
+
+def test_update_from_compatible_dict():
+    """Test that `update` skips checking the content of a dictionary with the same constraints."""
+    source = TypeConstrainedDict(str, int, {"a": 1})
+    dict.__setitem__(source, "b", "unchecked")  # bypass validation, to detect a second check
+    tc_dict = TypeConstrainedDict(str, int)
+    tc_dict.update(source)
+    assert tc_dict.data == {"a": 1, "b": "unchecked"}
+    with pytest.raises(TypeError):
+        TypeConstrainedDict(str, float).update(source)
+
+
+def test_error_messages():
+    """Test the error messages of `TypeConstrainedDict` for invalid keys and values."""
+    tc_dict = TypeConstrainedDict(str, int)
+    with pytest.raises(TypeError, match="Invalid key type: got int instead of str"):
+        tc_dict[1] = 1
+    with pytest.raises(TypeError, match="Invalid value type: got str instead of int"):
+        tc_dict["a"] = "1"
+
+
+def test_update_checks_each_pair_once(mocker):
+    """Test that `update` checks each key-value pair exactly once."""
+    tc_dict = TypeConstrainedDict(str, int)
+    check_key = mocker.patch.object(tc_dict, "_check_key", return_value=True)
+    check_value = mocker.patch.object(tc_dict, "_check_value", return_value=True)
+    tc_dict.update({"a": 1}, b=2)
+    assert tc_dict.data == {"a": 1, "b": 2}
+    assert check_key.call_count == 2
+    assert check_value.call_count == 2
+
+
+def test_list_other_mutators():
+    """Test that `insert` and `+=` constrain the types of the inserted values."""
+    tc_list = TypeConstrainedList(int, [1])
+    tc_list.insert(0, 0)
+    tc_list += [2]
+    assert tc_list == [0, 1, 2]
+    with pytest.raises(TypeError):
+        tc_list.insert(0, "a")
+    with pytest.raises(TypeError):
+        tc_list += ["a"]
+
+
+def test_dict_other_mutators():
+    """Test that `setdefault` and `|=` constrain the types of the inserted items."""
+    tc_dict = TypeConstrainedDict(str, int)
+    assert tc_dict.setdefault("a", 1) == 1
+    tc_dict |= {"b": 2}
+    assert tc_dict == {"a": 1, "b": 2}
+    with pytest.raises(TypeError):
+        tc_dict.setdefault("c", "3")
+    with pytest.raises(TypeError):
+        tc_dict |= {"c": "3"}
+
+
+@pytest.mark.parametrize(
+    "container",
+    [TypeConstrainedList(int, [1, 2]), TypeConstrainedDict(str, int, {"a": 1})],
+)
+def test_slots_copy_and_pickle(container):
+    """Test that slotted containers can be copied and pickled with their constraints."""
+    assert not hasattr(container, "__dict__")
+    for clone in (copy.deepcopy(container), pickle.loads(pickle.dumps(container))):
+        assert clone == container
+        assert clone.value_type is container.value_type
+        with pytest.raises(TypeError):
+            clone.update({"b": "2"}) if isinstance(clone, dict) else clone.append("2")
+
+
+class SlottedList(TypeConstrainedList):
+    """Constrained list subclass adding a slot."""
+
+    __slots__ = ("label",)
+
+
+class TaggedDict(TypeConstrainedDict):
+    """Constrained dictionary subclass storing attributes in an instance dictionary."""
+
+
+@pytest.mark.parametrize(
+    "container",
+    [SlottedList(int, [1, 2]), TaggedDict(str, int, {"a": 1})],
+    ids=["slots", "instance_dict"],
+)
+def test_subclass_state_copy_and_pickle(container):
+    """Test that the attributes added by subclasses are kept by copies and pickling."""
+    container.label = ["tag"]
+    copies = {
+        "copy": copy.copy(container),
+        "method": container.copy(),
+        "deepcopy": copy.deepcopy(container),
+        "pickle": pickle.loads(pickle.dumps(container)),
+    }
+    for kind, clone in copies.items():
+        assert type(clone) is type(container), kind
+        assert clone == container, kind
+        assert clone.label == ["tag"], kind
+    assert copies["copy"].label is container.label
+    assert copies["deepcopy"].label is not container.label
+
+
+def test_deepcopy_without_revalidation():
+    """Test that deep copies share immutable items, copy mutable ones, and skip validation."""
+    tc_list = TypeConstrainedList(list, [[1], [2]])
+    list.append(tc_list, "unchecked")  # bypass validation to detect whether it is re-checked
+    clone = copy.deepcopy(tc_list)
+    assert clone == tc_list
+    assert clone[0] is not tc_list[0]
+    tc_dict = TypeConstrainedDict(str, int, {"a": 1})
+    clone_dict = copy.deepcopy(tc_dict)
+    assert clone_dict == tc_dict
+    with pytest.raises(TypeError):
+        clone_dict["b"] = "2"
+
+
+def test_list_copies_keep_constraint():
+    """Test that copies, slices and concatenations of a list keep its type constraint."""
+    tc_list = TypeConstrainedList(int, [1, 2, 3])
+    for derived, expected in [
+        (tc_list.copy(), [1, 2, 3]),
+        (tc_list[1:], [2, 3]),
+        (tc_list + [4], [1, 2, 3, 4]),
+    ]:
+        assert isinstance(derived, TypeConstrainedList)
+        assert derived == expected
+        assert derived.value_type is int
+        with pytest.raises(TypeError):
+            derived.append("a")
+    assert tc_list[0] == 1  # single items are returned as is
+    with pytest.raises(TypeError):
+        tc_list + ["a"]  # pylint: disable=pointless-statement
+    assert tc_list == [1, 2, 3]
+
+
+def test_dict_copies_keep_constraints():
+    """Test that copies and unions of a dictionary keep its type constraints."""
+    tc_dict = TypeConstrainedDict(str, int, {"a": 1})
+    for derived, expected in [(tc_dict.copy(), {"a": 1}), (tc_dict | {"b": 2}, {"a": 1, "b": 2})]:
+        assert isinstance(derived, TypeConstrainedDict)
+        assert derived == expected
+        with pytest.raises(TypeError):
+            derived["c"] = "3"
+    with pytest.raises(TypeError):
+        tc_dict | {"b": "2"}  # pylint: disable=pointless-statement
+    with pytest.raises(TypeError):
+        tc_dict | [("b", 2)]  # pylint: disable=pointless-statement
+    assert tc_dict == {"a": 1}
+
+
+def test_list_same_constraints():
+    """Test the comparison of the type constraints of two lists."""
+    tc_list = TypeConstrainedList(Union[int, str])
+    assert tc_list.same_constraints(TypeConstrainedList(Union[int, str], [1]))
+    assert not tc_list.same_constraints(TypeConstrainedList(int))
+
+
+def test_dict_same_constraints():
+    """Test the comparison of the type constraints of two dictionaries."""
+    tc_dict = TypeConstrainedDict(str, Union[int, str])
+    assert tc_dict.same_constraints(TypeConstrainedDict(str, Union[int, str], {"a": 1}))
+    assert not tc_dict.same_constraints(TypeConstrainedDict(str, int))
+    assert not tc_dict.same_constraints(TypeConstrainedDict(int, Union[int, str]))
@@ -15,9 +15,11 @@ khimera.utils.mixins
 # pylint: disable=unused-import
 #   Importing pytest is necessary for the tests.
 
+import copy
+
 import pytest
 
-from khimera.utils.mixins import DeepCopyable, DeepComparable
+from khimera.utils.mixins import DeepCopyable, DeepComparable, DeepHashable
 
 
 # --- Mock Class for Testing Mixins ----------------------------------------------------------------
@@ -30,7 +32,7 @@ class NestedObject(DeepCopyable, DeepComparable):
         self.value = value
 
 
-class TestClass(DeepCopyable, DeepComparable):
+class TestClass(DeepCopyable, DeepHashable, DeepComparable):
     """Class which uses the DeepCopyable, DeepComparable, and DeepHashable mixins."""
 
     def __init__(self, nested, *args):
@@ -59,6 +61,65 @@ def test_deep_copyable():
     assert old.nested.value == new.nested.value
 
 
+def test_deep_copyable_shared_references():
+    """
+    Test that the `DeepCopyable` mixin preserves shared references and cycles in the copy.
+
+    Expected Behavior:
+
+    - An object referenced twice is copied once.
+    - An object referring to its container refers to the copy of the container.
+    """
+    nested = NestedObject(1)
+    old = TestClass(nested, nested)
+    old.nested.value = old  # cycle
+    new = old.copy()
+    assert new.mutable[0] is new.nested
+    assert new.nested.value is new
+    assert new.nested is not nested
+
+
+class SlottedObject(DeepCopyable):
+    """Class storing an attribute in a slot, alongside its instance dictionary."""
+
+    __slots__ = ("slotted",)
+
+    def __init__(self, slotted, value):
+        self.slotted = slotted
+        self.value = value
+
+
+class CustomCopyObject(DeepCopyable):
+    """Class defining its own deep copy, which marks the copies."""
+
+    def __init__(self, value):
+        self.value = value
+        self.copied = False
+
+    def __deepcopy__(self, memo):
+        new = CustomCopyObject(copy.deepcopy(self.value, memo))
+        new.copied = True
+        return new
+
+
+def test_deep_copyable_custom_hooks():
+    """
+    Test that the `DeepCopyable` mixin honours the slots and the `__deepcopy__` method of a class.
+
+    Expected Behavior:
+
+    - Attributes stored in slots are copied.
+    - The custom `__deepcopy__` method is used to create the copy.
+    """
+    old = SlottedObject([1], [2])
+    new = old.copy()
+    assert new.slotted == [1] and new.slotted is not old.slotted
+    assert new.value == [2] and new.value is not old.value
+    new = CustomCopyObject([1]).copy()
+    assert new.copied is True
+    assert new.value == [1]
+
+
 # --- Tests for DeepComparable ---------------------------------------------------------------------
 
 
@@ -77,3 +138,89 @@ def test_deep_comparable():
     obj3 = TestClass(NestedObject(2), 1, 2, 3)
     assert obj1 == obj2
     assert obj1 != obj3
+
+
+@pytest.mark.parametrize(
+    "args1, args2, expected",
+    [
+        ((1, 2, 3), (3, 2, 1), True),  # order of nested items is ignored
+        ((1, 2, 3), (1, 2), False),
+        (({"a": [1, 2]},), ({"a": [2, 1]},), True),
+        (({"a": 1},), ({"b": 1},), False),
+        ((1,), (1.0,), False),  # different types
+    ],
+)
+def test_deep_comparable_nested_containers(args1, args2, expected):
+    """Test the `DeepComparable` mixin on nested lists and dictionaries."""
+    obj1 = TestClass(NestedObject(1), *args1)
+    obj2 = TestClass(NestedObject(1), *args2)
+    assert (obj1 == obj2) is expected
+
+
+def test_deep_comparable_cycles():
+    """
+    Test the `DeepComparable` mixin on self-referencing objects.
+
+    Expected Behavior:
+
+    - Objects referring to themselves (through a nested object or a list) are compared in finite
+      time.
+    - They are equal if their other attributes are equal.
+    """
+    objects = []
+    for values in [(1, 2), (1, 2), (1, 3)]:
+        obj = TestClass(NestedObject(None), *values)
+        obj.nested.value = obj  # cycle through a nested object
+        obj.mutable.append(obj.mutable)  # cycle through a list
+        objects.append(obj)
+    assert objects[0] == objects[1]
+    assert objects[0] != objects[2]
+
+
+# --- Tests for DeepHashable -----------------------------------------------------------------------
+
+
+def test_deep_hashable():
+    """
+    Test the `DeepHashable` mixin.
+
+    Expected Behavior:
+
+    - Deeply equal objects should have the same hash, regardless of the order of nested items.
+    - The hash should change when an attribute is set or deleted.
+    - Self-referencing objects should be hashed in finite time.
+    """
+    obj1 = TestClass(NestedObject(1), 1, 2, 3)
+    obj2 = TestClass(NestedObject(1), 3, 2, 1)
+    assert obj1 == obj2
+    assert hash(obj1) == hash(obj2)
+    assert len({obj1, obj2}) == 1
+    old_hash = hash(obj1)
+    obj1.nested = NestedObject(2)
+    assert hash(obj1) != old_hash
+    old_hash = hash(obj1)
+    del obj1.nested
+    assert hash(obj1) != old_hash
+    obj1.nested = NestedObject(None)
+    obj1.nested.value = obj1  # cycle
+    assert isinstance(hash(obj1), int)
+
+
+def test_deep_hashable_cycles():
+    """Test that equivalent reference cycles of different lengths have the same hash."""
+    loop = TestClass(NestedObject(None), 1)
+    loop.nested.value = loop  # object referring to itself
+    first, second = TestClass(NestedObject(None), 1), TestClass(NestedObject(None), 1)
+    first.nested.value, second.nested.value = second, first  # objects referring to each other
+    assert loop == first
+    assert hash(loop) == hash(first)
+
+
+def test_deep_hashable_not_in_attributes():
+    """Test that the cached hash is neither compared nor copied with the attributes."""
+    obj1 = TestClass(NestedObject(1), 1, 2)
+    obj2 = TestClass(NestedObject(1), 1, 2)
+    hash(obj1)
+    assert "_hash" not in vars(obj1)
+    assert obj1 == obj2
+    assert hash(obj1.copy()) == hash(obj1)